@@ -0,0 +1,226 @@
+import glob
+import hashlib
+import os
+import pygame
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+Size = Optional[Tuple[int, int]]
+
+VARIANT_CACHE_SIZE = 48  # Scaled copies kept before the least recently used is dropped
+THUMBNAIL_CACHE_DIR = '.cache/thumbnails'  # Downscaled previews persisted between runs
+
+
+class RotationCache:
+    def __init__(self, base: pygame.Surface, steps: int):
+        self.base = base
+        self.steps = max(1, steps)
+        # One slot per quantized heading; memory is bounded by steps * sprite size
+        self._frames: List[Optional[pygame.Surface]] = [None] * self.steps
+        self._masks: List[Optional[pygame.mask.Mask]] = [None] * self.steps
+
+    def frame_index(self, angle: float) -> int:
+        return int(round(angle * self.steps / 360.0)) % self.steps
+
+    def get_frame(self, index: int) -> pygame.Surface:
+        frame = self._frames[index]
+        if frame is None:
+            frame = pygame.transform.rotate(self.base, index * 360.0 / self.steps)
+            self._frames[index] = frame
+        return frame
+
+    def get_mask(self, index: int) -> pygame.mask.Mask:
+        mask = self._masks[index]
+        if mask is None:
+            mask = pygame.mask.from_surface(self.get_frame(index))
+            self._masks[index] = mask
+        return mask
+
+    def prerender(self) -> None:
+        for index in range(self.steps):
+            self.get_frame(index)
+
+    def rendered_count(self) -> int:
+        return sum(1 for frame in self._frames if frame is not None)
+
+
+class Preloader:
+    def __init__(self, manager: 'AssetManager', items: Sequence[Tuple[str, bool]], workers: int = 4):
+        self.manager = manager
+        self.total = len(items)
+        self.installed = 0
+        # Decoding runs on worker threads; convert() needs the display, so it waits for poll() on the main thread
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='asset-loader')
+        self._pending: List[Tuple[Tuple[str, bool], Future]] = [
+            (item, self._executor.submit(pygame.image.load, item[0])) for item in items]
+
+    @property
+    def progress(self) -> float:
+        return self.installed / self.total if self.total else 1.0
+
+    @property
+    def finished(self) -> bool:
+        return not self._pending
+
+    def poll(self) -> int:
+        # Hands finished decodes to the manager; call once per frame from the main thread
+        still_pending = []
+        for (path, alpha), future in self._pending:
+            if future.done():
+                self.manager.install_source(path, alpha, future.result())
+                self.installed += 1
+            else:
+                still_pending.append(((path, alpha), future))
+        self._pending = still_pending
+        if not self._pending:
+            self._executor.shutdown(wait=False)
+        return self.installed
+
+    def cancel(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._pending = []
+
+
+class AssetManager:
+    def __init__(self):
+        self._sources: Dict[Tuple[str, bool], pygame.Surface] = {}  # Decoded images, one per file
+        # Scaled copies keyed by (path, size, alpha); LRU-bounded since full-screen copies are megabytes each
+        self._variants: 'OrderedDict[Tuple[str, Size, bool], pygame.Surface]' = OrderedDict()
+        self._rotations: Dict[Tuple[str, Size, int], RotationCache] = {}  # Pre-rotated frame sets
+        self._masks: Dict[Tuple[str, Size], pygame.mask.Mask] = {}  # Collision masks for unrotated sprites
+        self._thumbnails: Dict[Tuple[str, Tuple[int, int]], pygame.Surface] = {}  # Previews keyed by (path, size)
+        self.thumbnail_cache_dir = THUMBNAIL_CACHE_DIR
+        self.hits = 0  # Requests served from the cache
+        self.misses = 0  # Requests that had to build a new variant
+        self.disk_loads = 0  # Actual pygame.image.load calls
+        self.thumbnail_disk_hits = 0  # Previews read back from the on-disk cache
+        self.evictions = 0  # Scaled copies dropped by the LRU bound or a resize
+
+    def get_image(self, path: str, size: Size = None, alpha: bool = True) -> pygame.Surface:
+        key = (path, tuple(size) if size else None, alpha)
+        surface = self._variants.get(key)
+        if surface is not None:
+            self._variants.move_to_end(key)  # Mark as most recently used
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self._load_source(path, alpha)
+        if key[1] and key[1] != surface.get_size():
+            surface = pygame.transform.scale(surface, key[1])
+        self._variants[key] = surface
+        if len(self._variants) > VARIANT_CACHE_SIZE:
+            self._variants.popitem(last=False)  # Evict least recently used
+            self.evictions += 1
+        return surface
+
+    def evict_size(self, size: Tuple[int, int]) -> None:
+        # Called when the window leaves a size, so copies scaled for it don't linger until LRU eviction
+        size = (int(size[0]), int(size[1]))
+        for key in [key for key in self._variants if key[1] == size]:
+            del self._variants[key]
+            self.evictions += 1
+        for key in [key for key in self._thumbnails if key[1] == size]:
+            del self._thumbnails[key]
+
+    def get_rotations(self, path: str, size: Size, steps: int) -> RotationCache:
+        key = (path, tuple(size) if size else None, steps)
+        cache = self._rotations.get(key)
+        if cache is None:
+            cache = RotationCache(self.get_image(path, size), steps)
+            self._rotations[key] = cache
+        return cache
+
+    def get_mask(self, path: str, size: Size = None) -> pygame.mask.Mask:
+        key = (path, tuple(size) if size else None)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = pygame.mask.from_surface(self.get_image(path, size))
+            self._masks[key] = mask
+        return mask
+
+    def get_thumbnail(self, path: str, size: Tuple[int, int]) -> pygame.Surface:
+        # Full-size sources are decoded once per size and never kept; only the preview is cached
+        size = (int(size[0]), int(size[1]))
+        key = (path, size)
+        surface = self._thumbnails.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        cache_path, stale = self._thumbnail_cache_path(path, size)
+        if os.path.exists(cache_path):
+            surface = pygame.image.load(cache_path)
+            self.thumbnail_disk_hits += 1
+        else:
+            source = pygame.image.load(path)
+            self.disk_loads += 1
+            try:
+                surface = pygame.transform.smoothscale(source, size)
+            except ValueError:  # smoothscale only accepts 24 and 32 bit surfaces
+                surface = pygame.transform.scale(source, size)
+            self._save_thumbnail(surface, cache_path, stale)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        self._thumbnails[key] = surface
+        return surface
+
+    def _thumbnail_cache_path(self, path: str, size: Tuple[int, int]) -> Tuple[str, List[str]]:
+        # The source mtime is part of the name, so editing a map simply misses the old entry
+        prefix = f"{hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16]}_{size[0]}x{size[1]}_"
+        cache_path = os.path.join(self.thumbnail_cache_dir, f"{prefix}{os.stat(path).st_mtime_ns}.png")
+        stale = [p for p in glob.glob(os.path.join(self.thumbnail_cache_dir, prefix + "*.png")) if p != cache_path]
+        return cache_path, stale
+
+    def _save_thumbnail(self, surface: pygame.Surface, cache_path: str, stale: List[str]) -> None:
+        # The disk cache is only an accelerator; a read-only checkout just skips it
+        try:
+            os.makedirs(self.thumbnail_cache_dir, exist_ok=True)
+            pygame.image.save(surface, cache_path)
+            for old in stale:
+                os.remove(old)
+        except OSError:
+            pass
+
+    def preload(self, items: Sequence[Tuple[str, bool]], workers: int = 4) -> Preloader:
+        # items are (path, alpha) pairs; anything already decoded is skipped
+        return Preloader(self, [item for item in items if item not in self._sources], workers)
+
+    def install_source(self, path: str, alpha: bool, surface: pygame.Surface) -> pygame.Surface:
+        self.disk_loads += 1
+        # convert() needs a display mode; headless callers keep the raw surface
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        self._sources[(path, alpha)] = surface
+        return surface
+
+    def _load_source(self, path: str, alpha: bool) -> pygame.Surface:
+        surface = self._sources.get((path, alpha))
+        if surface is None:
+            surface = self.install_source(path, alpha, pygame.image.load(path))
+        return surface
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_loads": self.disk_loads,
+            "cached_variants": len(self._variants),
+            "thumbnails": len(self._thumbnails),
+            "evictions": self.evictions,
+            "thumbnail_disk_hits": self.thumbnail_disk_hits,
+            "rotation_frames": sum(cache.rendered_count() for cache in self._rotations.values()),
+        }
+
+    def clear(self) -> None:
+        self._sources.clear()
+        self._variants.clear()
+        self._rotations.clear()
+        self._masks.clear()
+        self._thumbnails.clear()
+
+
+# Shared instance used by every screen and entity
+assets = AssetManager()
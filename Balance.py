@@ -0,0 +1,101 @@
+import os
+
+# Workers simulate without opening a window; must be set before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from Game import Game
+from Headless import play_rounds
+from engine import load_bundle
+from towers import Tower
+
+# Usage (from the repository root):
+#   python Balance.py --layouts layouts.json --rounds 20 --output report.json
+#   python Balance.py --map assets/map_1.tdmap --layouts layouts.json --workers 8
+#
+# layouts.json holds a list of layouts, each {"name": ..., "towers": [[x, y], ...]} or a bare list of points.
+# --map takes a bundle written by PathDrawer.py; without it map 1 is used.
+
+Point = Tuple[int, int]
+
+
+def load_layouts(path: str) -> List[Tuple[str, List[Point]]]:
+    with open(path) as f:
+        data = json.load(f)
+    layouts = []
+    for i, entry in enumerate(data):
+        if isinstance(entry, dict):
+            name, towers = entry.get("name", f"layout_{i}"), entry["towers"]
+        else:
+            name, towers = f"layout_{i}", entry
+        layouts.append((name, [(int(x), int(y)) for x, y in towers]))
+    return layouts
+
+
+def evaluate_layout(job: Tuple[str, Sequence[Point], Optional[str], int, int, int]) -> Dict[str, object]:
+    # Runs in a worker process: one headless game per layout, nothing shared between jobs
+    name, towers, map_path, rounds, seed, max_ticks = job
+    start = time.perf_counter()
+    game = Game(seed=seed, map_bundle=load_bundle(map_path) if map_path else None)
+    placed = sum(bool(game.place_tower(Tower(x, y))) for x, y in towers)
+    money_curve = [summary["money"] for summary in play_rounds(game, rounds, max_ticks)]
+    return {
+        "name": name,
+        "towers": [list(point) for point in towers],
+        "placed": placed,
+        "rounds_survived": len(money_curve),
+        "leaks": game.leaks,
+        "lives": game.lives,
+        "pops": game.pops,
+        "money_curve": money_curve,
+        "ticks": game.ticks,
+        "elapsed_s": round(time.perf_counter() - start, 3),
+    }
+
+
+def run_batch(layouts: Sequence[Tuple[str, Sequence[Point]]], rounds: int = 10, map_path: Optional[str] = None,
+              seed: int = 0, max_ticks: int = 100_000, workers: Optional[int] = None) -> Dict[str, object]:
+    # Workers get the bundle's path, not its tables; each one memory-maps the file itself
+    jobs = [(name, towers, map_path, rounds, seed, max_ticks) for name, towers in layouts]
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(evaluate_layout, jobs))
+    # Best layouts first: survive longest, then leak least, then finish richest
+    results.sort(key=lambda r: (-r["rounds_survived"], r["leaks"], -(r["money_curve"][-1] if r["money_curve"] else 0)))
+    return {
+        "rounds": rounds,
+        "seed": seed,
+        "layouts": len(results),
+        "workers": workers or os.cpu_count(),
+        "elapsed_s": round(time.perf_counter() - start, 3),
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate tower layouts in parallel headless games")
+    parser.add_argument("--layouts", required=True, help="JSON file of candidate tower layouts")
+    parser.add_argument("--map", help="Map bundle (.tdmap) to play on")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=100_000, help="Give up on a round after this many ticks")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per core)")
+    parser.add_argument("--output", help="Write the report here instead of stdout")
+    args = parser.parse_args()
+
+    report = run_batch(load_layouts(args.layouts), args.rounds, args.map,
+                       args.seed, args.max_ticks, args.workers)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,402 @@
+import math
+import pygame
+import numpy as np
+from AssetManager import assets
+from engine import SIM_PHASES, BloonSwarm, PlacementGrid, TrackPath, WaveSchedule, earliest_hits, select_targets
+from engine import PLAYFIELD_SIZE, load_bundle
+from engine import replay
+from towers import DartPool, Tower
+from ui import RenderQueue, TowerSidebar
+from Utils import render_text
+
+# Colors
+WHITE = (255, 255, 255)
+BLUE = (0, 0, 255)
+BLACK = (0, 0, 0)
+VALID_PLACEMENT = (0, 200, 0, 90)
+INVALID_PLACEMENT = (220, 0, 0, 90)
+MASK_SCAN_STEP = 2  # Pixels of dart travel between sprite-mask tests along a sweep
+
+WAVES_PATH = 'assets/waves.json'
+MAP_BUNDLE_PATH = 'assets/map_{}.tdmap'  # Written by PathDrawer.py next to each map image
+
+
+def map_bundle_path(number):
+    return MAP_BUNDLE_PATH.format(number)
+
+
+class Game:
+    def __init__(self, width=PLAYFIELD_SIZE[0], height=PLAYFIELD_SIZE[1], seed=0, waves=None, map_number=1, map_bundle=None):
+        self.width, self.height = width, height
+        self.background_size = (width, height)
+        self.seed = seed  # Carried into summaries and replays; the simulation itself has no randomness
+        self.ticks = 0
+        self.time_step = 1.0  # Game time per tick, in 60 Hz frames; raise it to fast-forward
+        self.game_time = 0.0  # Sum of time steps so far; spawns are scheduled against this
+        self.recorder = None  # Optional ReplayRecorder fed by every player action
+        self.pops = 0
+        self.leaks = 0
+        self.shots = 0
+        self.towers = []
+        self.darts = DartPool()
+        self.round = 1
+        self.lives = 100
+        self.money = 500
+        self.map_number = map_number
+        self.map = map_bundle or load_bundle(map_bundle_path(map_number))
+        self.original_path = self.map.waypoints  # In pixels of the playfield the bundle was baked for
+        self.bloon_image = assets.get_image('assets/bloon.png')
+        self.bloon_mask = assets.get_mask('assets/bloon.png')
+        # Collision radius hugs the visible balloon rather than the padded sprite
+        bounds = self.bloon_mask.get_bounding_rects()
+        bloon_radius = max(bounds[0].size) / 2 if bounds else max(self.bloon_image.get_size()) / 2
+        self.fit_map()
+        self.bloons = BloonSwarm(self.track, bloon_radius)
+        self.pixel_collisions = False  # Confirm circle hits against sprite masks
+        self.enforce_placement = True  # Reject towers on the path or overlapping another tower
+        self.placement_previews = {}  # Validity -> translucent footprint disk drawn under a dragged tower
+        self.sidebar = TowerSidebar(self.width, self.height)
+        self.selected_tower = None
+        self.dragging_tower = None
+
+        # Rendering state: map, path and sidebar never move, so they are composited once
+        self.static_layer = None
+        self.full_redraw = True
+        self.dirty_rects = []  # Regions drawn over last frame, restored from the static layer
+        self.render_queue = RenderQueue()
+        
+        # Wave spawning variables
+        self.waves = waves or WaveSchedule.load(WAVES_PATH)
+        self.spawn_queue = None  # Pending spawns for the current wave, ordered by tick
+        self.bloons_per_wave = self.waves.bloon_count(self.round)
+        self.bloons_spawned = 0
+        self.wave_in_progress = False
+        self.wave_complete = False
+        self.wave_start_delay = 180  # 3 seconds between waves
+
+    def fit_map(self):
+        # Bundles are baked at the size the game opens at, so their tables are used as-is;
+        # only a window of another size scales the waypoints and rebuilds them
+        bundle = self.map
+        if (self.width, self.height) == (bundle.width, bundle.height) and bundle.footprint == Tower.footprint:
+            self.track = bundle.track
+            self.placement = bundle.placement_grid()
+        else:
+            sx, sy = self.width / bundle.width, self.height / bundle.height
+            self.track = TrackPath([(x * sx, y * sy) for x, y in self.original_path])
+            self.placement = PlacementGrid(self.width, self.height, self.track, Tower.footprint,
+                                           bundle.path_half_width, bundle.cell_size)
+        self.path = [(int(x), int(y)) for x, y in self.track.points.tolist()]
+
+    def start_wave(self):
+        self.record(replay.START_WAVE)
+        if self.wave_in_progress:
+            return
+        if self.wave_complete:
+            self.round += 1
+            self.wave_complete = False
+        self.wave_in_progress = True
+        self.bloons_per_wave = self.waves.bloon_count(self.round)
+        self.bloons_spawned = 0
+        self.spawn_queue = self.waves.compile(self.round, self.game_time)
+
+    def spawn_bloon(self):
+        if self.wave_in_progress:
+            for due, bloon in self.spawn_queue.pop_due(self.game_time):
+                # Spawns that fell due since the last tick have already been walking for the difference
+                self.bloons.spawn(bloon.health, bloon.speed, progress=bloon.speed * (self.game_time - due))
+                self.bloons_spawned += 1
+            if self.spawn_queue.empty and len(self.bloons) == 0:  # All bloons from wave are gone
+                self.wave_in_progress = False
+                self.wave_complete = True
+                self.spawn_queue = None
+
+    def update_bloons(self):
+        leaked, popped = self.bloons.step(self.time_step)
+        self.lives -= leaked
+        self.money += popped
+        self.leaks += leaked
+        self.pops += popped
+
+    def update_towers(self):
+        # Only towers off cooldown need a target; they share one progress-sorted view of the swarm
+        ready = [tower for tower in self.towers if tower.is_ready()]
+        targets = dict(zip(map(id, ready), select_targets(self.bloons, ready)))
+        for tower in self.towers:
+            target = targets.get(id(tower), -1)
+            self.shots += tower.shoot(self.bloons.position(target) if target >= 0 else None, self.darts,
+                                      self.time_step)
+
+    def update_darts(self):
+        for dart in self.darts:
+            dart.move(self.width, self.height, self.time_step)
+        if len(self.darts) and len(self.bloons):
+            # Each dart sweeps the segment it covered this tick, so long steps can't tunnel
+            # through a bloon. Hits don't remove bloons until the next update_bloons, so every
+            # dart is tested against the swarm's spatial hash in one batch.
+            x0, y0, x1, y1, radii = self.darts.collision_arrays()
+            query, bloon, t = self.bloons.segment_hits(x0, y0, x1, y1, radii)
+            if self.pixel_collisions and query.size:
+                keep = [self.masks_overlap(self.darts[q], b, s)
+                        for q, b, s in zip(query.tolist(), bloon.tolist(), t.tolist())]
+                query, bloon, t = query[keep], bloon[keep], t[keep]
+            hits = earliest_hits(len(self.darts), query, bloon, t)
+            hit_darts = np.flatnonzero(hits >= 0)
+            if hit_darts.size:
+                self.bloons.damage_many(hits[hit_darts], 50)
+                for i in hit_darts.tolist():
+                    self.darts[i].active = False
+        # Darts that left the screen still got their sweep above
+        self.darts.remove_inactive()
+
+    def masks_overlap(self, dart, bloon_index, t=0.0):
+        # Walk the sweep from first contact (t) to where the dart leaves the bloon's circle, comparing
+        # sprites every MASK_SCAN_STEP pixels; one overlapping point is a hit, so long steps can't tunnel
+        half_w, half_h = self.bloon_image.get_width() // 2, self.bloon_image.get_height() // 2
+        x, y = self.bloons.position(bloon_index)
+        dx, dy = dart.x - dart.prev_x, dart.y - dart.prev_y
+        fx, fy = dart.prev_x - x, dart.prev_y - y
+        limit = float(self.bloons.radius[bloon_index]) + dart.radius
+        a = dx * dx + dy * dy
+        b = fx * dx + fy * dy
+        c = fx * fx + fy * fy - limit * limit
+        exit_t = min(1.0, (-b + math.sqrt(max(b * b - a * c, 0.0))) / a) if a > 0 else t
+        samples = max(1, math.ceil((exit_t - t) * math.sqrt(a) / MASK_SCAN_STEP))
+        dart_mask = dart.get_mask()
+        for i in range(samples + 1):
+            s = t + (exit_t - t) * i / samples
+            dart_x = dart.prev_x + dx * s - dart.rect.width / 2
+            dart_y = dart.prev_y + dy * s - dart.rect.height / 2
+            offset = (round(dart_x) - (int(x) - half_w), round(dart_y) - (int(y) - half_h))
+            if self.bloon_mask.overlap(dart_mask, offset) is not None:
+                return True
+        return False
+
+    def tick(self, timer=None):
+        # One fixed simulation step; independent of the display and frame rate
+        steps = (self.spawn_bloon, self.update_bloons, self.update_towers, self.update_darts)
+        if timer is None:
+            for step in steps:
+                step()
+        else:
+            for name, step in zip(SIM_PHASES, steps):
+                with timer.phase(name):
+                    step()
+        self.ticks += 1
+        self.game_time += self.time_step
+
+    def place_tower(self, tower):
+        catalog = self.sidebar.catalog
+        slot = catalog.index(type(tower)) if type(tower) in catalog else 0
+        self.record(replay.PLACE, tower.rect.centerx, tower.rect.centery, slot)
+        if self.money < tower.cost or not self.can_place(tower.rect.center):
+            return False
+        self.money -= tower.cost
+        tower.place_on(self.track)
+        self.towers.append(tower)
+        self.placement.occupy(*tower.rect.center)
+        return True
+
+    def can_place(self, pos):
+        return not self.enforce_placement or self.placement.can_place(*pos)
+
+    def upgrade_tower(self, tower):
+        self.record(replay.UPGRADE, self.towers.index(tower))
+        if self.money >= tower.upgrade_cost:
+            if tower.upgrade():
+                self.money -= tower.upgrade_cost
+
+    def sell_tower(self, tower):
+        self.record(replay.SELL, self.towers.index(tower))
+        self.money += tower.sell()
+        self.towers.remove(tower)
+        self.placement.release(*tower.rect.center)
+        if tower is self.selected_tower:
+            self.selected_tower = None
+
+    def cycle_tower_targeting(self, tower):
+        self.record(replay.TARGET, self.towers.index(tower))
+        tower.cycle_targeting()
+
+    def record(self, action, a=0, b=0, c=0):
+        # Tagged with the tick about to run, which is when playback re-applies it
+        if self.recorder is not None:
+            self.recorder.record(self.ticks, action, a, b, c)
+
+    def apply_replay_event(self, event):
+        if event.action == replay.PLACE:
+            self.place_tower(self.sidebar.catalog[event.c](event.a, event.b))
+        elif event.action == replay.UPGRADE:
+            self.upgrade_tower(self.towers[event.a])
+        elif event.action == replay.SELL:
+            self.sell_tower(self.towers[event.a])
+        elif event.action == replay.TARGET:
+            self.cycle_tower_targeting(self.towers[event.a])
+        elif event.action == replay.START_WAVE:
+            self.start_wave()
+        elif event.action == replay.RESIZE:
+            self.resize(event.a, event.b)
+
+    def summary(self):
+        return {
+            "seed": self.seed,
+            "round": self.round,
+            "lives": self.lives,
+            "money": self.money,
+            "pops": self.pops,
+            "leaks": self.leaks,
+            "shots": self.shots,
+            "ticks": self.ticks,
+            "towers": len(self.towers),
+        }
+
+    def build_static_layer(self, size):
+        self.static_layer = pygame.Surface(size).convert() if pygame.display.get_surface() else pygame.Surface(size)
+        self.static_layer.fill(WHITE)
+        background_img = assets.get_image(self.map.image, self.background_size, alpha=False)
+        self.static_layer.blit(background_img, (0, 0))
+
+        # Draw path
+        for i in range(len(self.path) - 1):
+            pygame.draw.line(self.static_layer, BLUE, self.path[i], self.path[i + 1], 5)
+
+        # Draw sidebar
+        self.sidebar.draw(self.static_layer)
+        self.full_redraw = True
+
+    def invalidate_static_layer(self):
+        # Call when the map, path or sidebar changes
+        self.static_layer = None
+
+    def request_full_redraw(self):
+        self.full_redraw = True
+
+    def mark_dirty(self, rect):
+        # Something outside Game drew over the screen; restore that area next frame
+        self.dirty_rects.append(pygame.Rect(rect))
+
+    def draw(self, screen):
+        # Returns the screen regions that changed, for pygame.display.update
+        if self.static_layer is None or self.static_layer.get_size() != screen.get_size():
+            self.build_static_layer(screen.get_size())
+        if self.full_redraw:
+            screen.blit(self.static_layer, (0, 0))
+        else:
+            for rect in self.dirty_rects:
+                screen.blit(self.static_layer, rect, rect)
+        previous = self.dirty_rects
+        dirty = self.dirty_rects = []
+
+        # Draw game objects: queued per layer, culled to the screen, one Surface.blits per layer
+        queue = self.render_queue
+        queue.begin(screen.get_rect())
+        view = self.bloons.view()
+        queue.add_sprites('bloons', self.bloon_image, view.x, view.y)
+        queue.add_rects('towers', [tower.image for tower in self.towers], [tower.rect for tower in self.towers])
+        darts = self.darts.active
+        queue.add_rects('darts', [dart.image for dart in darts], [dart.rect for dart in darts])
+        dirty.extend(queue.flush(screen))
+        if self.selected_tower is not None:
+            dirty.extend(self.selected_tower.draw_selection(screen))
+
+        dirty.extend(self.sidebar.draw_overlays(screen, pygame.mouse.get_pos(), self.money))
+
+        if self.dragging_tower:
+            center = self.dragging_tower.rect.center
+            preview = self.placement_preview(self.can_place(center) and not self.sidebar.rect.collidepoint(center))
+            dirty.append(screen.blit(preview, preview.get_rect(center=center)))
+            dirty.append(screen.blit(self.dragging_tower.image, self.dragging_tower.rect.topleft))
+
+        # Draw UI elements
+        money_text = render_text(f"Money: ${self.money}", 36, BLACK)
+        lives_text = render_text(f"Lives: {self.lives}", 36, BLACK)
+        round_text = render_text(f"Round: {self.round}", 36, BLACK)
+        dirty.append(screen.blit(money_text, (10, 10)))
+        dirty.append(screen.blit(lives_text, (10, 50)))
+        dirty.append(screen.blit(round_text, (10, 90)))
+
+        # Draw wave status
+        if self.wave_complete:
+            wave_text = render_text("Press SPACE for next wave", 36, (0, 255, 0))
+            dirty.append(screen.blit(wave_text, (self.width // 2 - 150, 10)))
+        elif not self.wave_in_progress:
+            wave_text = render_text("Press SPACE to start wave", 36, (255, 255, 0))
+            dirty.append(screen.blit(wave_text, (self.width // 2 - 150, 10)))
+
+        if self.full_redraw:
+            self.full_redraw = False
+            return [screen.get_rect()]
+        return previous + dirty
+
+    def placement_preview(self, valid):
+        preview = self.placement_previews.get(valid)
+        if preview is None:
+            radius = int(Tower.footprint)
+            preview = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(preview, VALID_PLACEMENT if valid else INVALID_PLACEMENT, (radius, radius), radius)
+            self.placement_previews[valid] = preview
+        return preview
+
+    def handle_events(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Left click
+                pos = pygame.mouse.get_pos()
+                
+                # Check if clicking in sidebar
+                if self.sidebar.rect.collidepoint(pos):
+                    tower = self.sidebar.handle_mouse_down(pos)
+                    if tower and self.money >= tower.cost:
+                        self.dragging_tower = tower
+                else:
+                    # Check if clicking on existing tower
+                    for tower in self.towers:
+                        if tower.rect.collidepoint(pos):
+                            # Deselect other towers
+                            for t in self.towers:
+                                t.is_selected = False
+                            tower.is_selected = True
+                            self.selected_tower = tower
+                            break
+                    else:
+                        # Deselect all towers if clicking empty space
+                        for tower in self.towers:
+                            tower.is_selected = False
+                        self.selected_tower = None
+
+            elif event.button == 3:  # Right click
+                if self.selected_tower:
+                    action = self.selected_tower.handle_click(event.pos)
+                    if action == "upgrade":
+                        self.upgrade_tower(self.selected_tower)
+                    elif action == "sell":
+                        self.sell_tower(self.selected_tower)
+                    elif action == "target":
+                        self.cycle_tower_targeting(self.selected_tower)
+
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if event.button == 1 and self.dragging_tower:
+                pos = pygame.mouse.get_pos()
+                if not self.sidebar.rect.collidepoint(pos):
+                    # Place tower if we have enough money
+                    self.place_tower(self.dragging_tower)
+                self.dragging_tower = None
+
+        elif event.type == pygame.MOUSEMOTION:
+            if self.dragging_tower:
+                self.dragging_tower.rect.center = pygame.mouse.get_pos()
+
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE:
+                self.start_wave()
+
+    def resize(self, new_width, new_height):
+        self.record(replay.RESIZE, new_width, new_height)
+        self.width, self.height = new_width, new_height
+        self.background_size = (new_width, new_height)
+        self.fit_map()
+        self.bloons.set_path(self.track)
+        for tower in self.towers:
+            tower.place_on(self.track)
+            self.placement.occupy(*tower.rect.center)
+        self.sidebar = TowerSidebar(self.width, self.height)
+        self.invalidate_static_layer()
@@ -0,0 +1,91 @@
+import os
+
+# Simulate without opening a window; must be set before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import json
+import time
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from Game import Game
+from engine import PhaseTimer, ReplayPlayer
+from towers import Tower
+
+# Usage (from the repository root):
+#   python Headless.py --rounds 10 --tower 170,490 --tower 590,300 --seed 1
+#   python Headless.py --replay session.tdrp
+
+
+def run_headless(rounds: int = 10, towers: Iterable[Tuple[int, int]] = (), seed: int = 0,
+                 max_ticks_per_round: int = 100_000, game: Optional[Game] = None,
+                 time_step: float = 1.0) -> Dict[str, int]:
+    # Plays whole waves at a fixed timestep as fast as the CPU allows
+    game = game or Game(seed=seed)
+    game.time_step = time_step
+    for x, y in towers:
+        game.place_tower(Tower(x, y))
+
+    for _ in play_rounds(game, rounds, max_ticks_per_round):
+        pass
+    return game.summary()
+
+
+def play_rounds(game: Game, rounds: int, max_ticks_per_round: int = 100_000) -> Iterator[Dict[str, int]]:
+    # Yields the summary after each round survived; stops early once the game is lost or stalls
+    for _ in range(rounds):
+        game.start_wave()
+        round_ticks = 0
+        while not game.wave_complete and game.lives > 0 and round_ticks < max_ticks_per_round:
+            game.tick()
+            round_ticks += 1
+        if game.lives <= 0 or not game.wave_complete:
+            break
+        yield game.summary()
+
+
+def run_replay(path: str, max_ticks: int = 1_000_000) -> Dict[str, object]:
+    # Re-runs a recorded session tick for tick and reports where the time went
+    player = ReplayPlayer.load(path)
+    game = Game(player.width, player.height, seed=player.seed, map_number=player.map_number)
+    timer = PhaseTimer()
+    start = time.perf_counter()
+    while game.ticks < max_ticks and game.lives > 0:
+        player.apply_due(game)
+        if player.finished and not game.wave_in_progress:
+            break
+        game.tick(timer)
+    elapsed = time.perf_counter() - start
+
+    result: Dict[str, object] = dict(game.summary())
+    result["events"] = len(player.events)
+    result["elapsed_s"] = round(elapsed, 3)
+    result["phase_ms"] = timer.summary_ms()
+    return result
+
+
+def parse_point(text: str) -> Tuple[int, int]:
+    x, y = text.split(",")
+    return int(x), int(y)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the tower defense simulation without rendering")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--tower", type=parse_point, action="append", default=[],
+                        help="Tower position as x,y; repeat for more towers")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=100_000, help="Give up on a round after this many ticks")
+    parser.add_argument("--time-step", type=float, default=1.0,
+                        help="Game time per tick in 60 Hz frames; larger steps need fewer ticks")
+    parser.add_argument("--replay", metavar="PATH", help="Play back a recorded session instead of scripted rounds")
+    args = parser.parse_args()
+
+    if args.replay:
+        print(json.dumps(run_replay(args.replay), indent=2))
+    else:
+        print(json.dumps(run_headless(args.rounds, args.tower, args.seed, args.max_ticks,
+                                      time_step=args.time_step), indent=2))
+
+
+if __name__ == "__main__":
+    main()
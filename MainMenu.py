@@ -1,22 +1,23 @@
 import pygame
-from Utils import Button
+from Utils import Button, render_text
 from Settings import SettingsMenu
+from AssetManager import assets
 
 class MainMenu:
     def __init__(self, player_name, screen_width, screen_height):
         self.player_name = player_name
-        self.background = pygame.image.load('assets/background.png')  # Load background image
-        self.settings_icon = pygame.image.load('assets/settings_icon.png')  # Load settings icon image
+        self.background_path = 'assets/background.png'  # Scaled per window size through the asset cache
+        self.settings_icon_path = 'assets/settings_icon.png'
+        self.settings_icon_rect = pygame.Rect(10, 50, 0, 0)  # Sized on first draw
         self.play_button = Button(0, 0, 0, 0, (0, 255, 0), "Play", border_radius=5)  # Initialize play button
         self.settings_menu = SettingsMenu(screen_width, screen_height)  # Initialize settings menu
 
     def draw(self, screen):
         screen_width, screen_height = screen.get_size()  # Get current screen size
-        background = pygame.transform.scale(self.background, (screen_width, screen_height))  # Scale background to fit screen
+        background = assets.get_image(self.background_path, (screen_width, screen_height), alpha=False)  # Background scaled to fit screen (cached)
         screen.blit(background, (0, 0))  # Draw background
         
-        font = pygame.font.SysFont(None, 36)
-        name_text = font.render(self.player_name, True, (0, 0, 0))  # Render player's name
+        name_text = render_text(self.player_name, 36, (0, 0, 0))  # Render player's name (cached)
         text_rect = name_text.get_rect(topleft=(10, 10))  # Position for player's name
         
         # Draw border with border radius behind the player's username
@@ -33,12 +34,11 @@ class MainMenu:
         
         # Ensure the settings icon is always square
         icon_size = min(screen_width, screen_height) // 20  # Calculate icon size
-        settings_icon = pygame.transform.scale(self.settings_icon, (icon_size, icon_size))  # Scale settings icon
-        screen.blit(settings_icon, (10, 50))  # Draw settings icon
+        settings_icon = assets.get_image(self.settings_icon_path, (icon_size, icon_size))  # Scaled settings icon (cached)
+        self.settings_icon_rect = screen.blit(settings_icon, (10, 50))  # Draw settings icon
         
         # Draw main menu text "Tower Defence"
-        title_font = pygame.font.SysFont(None, 72)
-        title_text = title_font.render("Tower Defence", True, (0, 0, 0))  # Render title text
+        title_text = render_text("Tower Defence", 72, (0, 0, 0))  # Render title text (cached)
         title_rect = title_text.get_rect(center=(screen_width // 2, screen_height // 4))  # Position for title text
         screen.blit(title_text, title_rect.topleft)  # Draw title text
         
@@ -54,8 +54,7 @@ class MainMenu:
             if event.button == 1:  # Check for left mouse button click
                 if self.play_button and self.play_button.clicked(event.pos):  # Check if play button is clicked
                     return "map_selector"  # Return map selector screen
-                settings_icon_rect = pygame.Rect(10, 50, self.settings_icon.get_width(), self.settings_icon.get_height())  # Get settings icon rect
-                if settings_icon_rect.collidepoint(event.pos):  # Check if settings icon is clicked
+                if self.settings_icon_rect.collidepoint(event.pos):  # Check if settings icon is clicked
                     self.settings_menu.toggle_visibility()  # Toggle settings menu visibility
         if self.settings_menu.visible:
             self.settings_menu.handle_events(event)  # Handle events for settings menu if visible
@@ -1,76 +1,122 @@
+import glob
+import os
+import re
 import pygame
-from Utils import Button
+from Utils import Button, render_text
+from AssetManager import assets
+
+MAP_PATTERN = re.compile(r'map_(\d+)\.png$')
+COLUMNS, ROWS = 4, 2
+PAGE_SIZE = COLUMNS * ROWS
+
+def find_maps(directory='assets'):
+    # Only lists files; nothing is decoded until its page is shown
+    maps = []
+    for path in glob.glob(os.path.join(directory, 'map_*.png')):
+        match = MAP_PATTERN.search(os.path.basename(path))
+        if match:
+            maps.append((int(match.group(1)), path))
+    return sorted(maps)
+
+def has_bundle(image_path):
+    # PathDrawer writes each map's bundle next to its image (assets/map_3.png -> assets/map_3.tdmap)
+    return os.path.exists(os.path.splitext(image_path)[0] + '.tdmap')
 
 class MapSelector:
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.background = pygame.image.load('assets/map_selector_background.png')
-        self.map_thumbnails = [pygame.image.load(f'assets/map_{i}.png') for i in range(1, 5)]
-        self.update_layout()
+        self.background_path = 'assets/map_selector_background.png'
+        self.maps = find_maps()  # (map number, image path), in display order
+        self.traced = {number for number, path in self.maps if has_bundle(path)}  # Maps with a path to play on
         self.current_page = 0
+        self.next_button = Button(0, 0, 100, 50, (0, 255, 0), "Next", border_radius=5)
+        self.prev_button = Button(0, 0, 100, 50, (0, 255, 0), "Prev", border_radius=5)
+        self.back_button = Button(0, 0, 100, 50, (255, 0, 0), "Back", border_radius=5)
+        self.update_layout()
+
+    @property
+    def page_count(self):
+        return max(1, -(-len(self.maps) // PAGE_SIZE))
+
+    def set_page(self, page):
+        self.current_page = max(0, min(page, self.page_count - 1))
+
+    def visible_maps(self):
+        start = self.current_page * PAGE_SIZE
+        return self.maps[start:start + PAGE_SIZE]
 
     def update_layout(self):
+        old_size = getattr(self, 'thumbnail_size', None)
         self.thumbnail_size = self.calculate_thumbnail_size()
+        if old_size and old_size != self.thumbnail_size:
+            assets.evict_size(old_size)  # Previews at the old size won't be shown again
         self.thumbnail_rects = self.calculate_thumbnail_positions()
-        self.next_button = pygame.Rect(self.screen_width - 150, self.screen_height - 100, 100, 50)
-        self.prev_button = pygame.Rect(50, self.screen_height - 100, 100, 50)
-        self.back_button = pygame.Rect(50, 50, 100, 50)
 
     def calculate_thumbnail_size(self):
         grid_width = self.screen_width * 0.8
         grid_height = self.screen_height * 0.6
-        thumbnail_width = grid_width // 4
-        thumbnail_height = grid_height // 2
+        thumbnail_width = int(grid_width // COLUMNS)
+        thumbnail_height = int(grid_height // ROWS)
         return (thumbnail_width, thumbnail_height)
 
     def calculate_thumbnail_positions(self):
         positions = []
-        start_x = (self.screen_width - (self.thumbnail_size[0] * 4)) // 2
-        start_y = (self.screen_height - (self.thumbnail_size[1] * 2)) // 2
-        for row in range(2):
-            for col in range(4):
+        start_x = (self.screen_width - (self.thumbnail_size[0] * COLUMNS)) // 2
+        start_y = (self.screen_height - (self.thumbnail_size[1] * ROWS)) // 2
+        for row in range(ROWS):
+            for col in range(COLUMNS):
                 x = start_x + col * self.thumbnail_size[0]
                 y = start_y + row * self.thumbnail_size[1]
                 positions.append(pygame.Rect(x, y, self.thumbnail_size[0], self.thumbnail_size[1]))
         return positions
 
     def draw(self, screen):
-        self.screen_width, self.screen_height = screen.get_size()
-        self.update_layout()
-        background_resized = pygame.transform.scale(self.background, (self.screen_width, self.screen_height))
-        screen.blit(background_resized, (0, 0))
-        
-        for i, thumbnail in enumerate(self.map_thumbnails):
-            resized_thumbnail = pygame.transform.scale(thumbnail, self.thumbnail_size)
-            screen.blit(resized_thumbnail, self.thumbnail_rects[i])
-        
-        self.next_button = Button(self.screen_width - 150, self.screen_height - 100, 100, 50, (0, 255, 0), "Next", border_radius=5)
-        self.prev_button = Button(50, self.screen_height - 100, 100, 50, (0, 255, 0), "Prev", border_radius=5)
-        self.back_button = Button(50, 50, 100, 50, (255, 0, 0), "Back", border_radius=5)
-        
-        self.next_button.draw(screen)
-        self.prev_button.draw(screen)
+        if screen.get_size() != (self.screen_width, self.screen_height):
+            self.screen_width, self.screen_height = screen.get_size()
+            self.update_layout()
+        background = assets.get_image(self.background_path, (self.screen_width, self.screen_height), alpha=False)
+        screen.blit(background, (0, 0))
+
+        # Thumbnails are built once per size, and only for the page being shown
+        for (number, path), rect in zip(self.visible_maps(), self.thumbnail_rects):
+            screen.blit(assets.get_thumbnail(path, self.thumbnail_size), rect)
+            if number not in self.traced:
+                self.draw_untraced(screen, rect)
+
+        # Positions are reapplied every frame so the click animation always starts from full size
+        self.next_button.rect = pygame.Rect(self.screen_width - 150, self.screen_height - 100, 100, 50)
+        self.prev_button.rect = pygame.Rect(50, self.screen_height - 100, 100, 50)
+        self.back_button.rect = pygame.Rect(50, 50, 100, 50)
+        if self.current_page < self.page_count - 1:
+            self.next_button.draw(screen)
+        if self.current_page > 0:
+            self.prev_button.draw(screen)
         self.back_button.draw(screen)
 
+    def draw_untraced(self, screen, rect):
+        # Dimmed with a hint; clicking it does nothing until PathDrawer.py has exported a bundle
+        shade = pygame.Surface(rect.size, pygame.SRCALPHA)
+        shade.fill((0, 0, 0, 150))
+        screen.blit(shade, rect)
+        label = render_text("No path yet", 24, (255, 255, 255))
+        screen.blit(label, label.get_rect(center=rect.center))
+
     def handle_events(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.next_button.clicked(event.pos):
-                self.current_page += 1
+                self.set_page(self.current_page + 1)
             elif self.prev_button.clicked(event.pos):
-                self.current_page -= 1
+                self.set_page(self.current_page - 1)
             elif self.back_button.clicked(event.pos):
                 return "main_menu"
             else:
-                for i, rect in enumerate(self.thumbnail_rects):
-                    if rect.collidepoint(event.pos):
-                        return f"map_{i + 1}"
+                for (number, _), rect in zip(self.visible_maps(), self.thumbnail_rects):
+                    if rect.collidepoint(event.pos) and number in self.traced:
+                        return f"map_{number}"
         elif event.type == pygame.MOUSEWHEEL:
-            self.current_page += event.y
-        elif event.type == pygame.MOUSEMOTION:
-            if event.buttons[0]:
-                self.current_page += event.rel[1] // 10
+            self.set_page(self.current_page + event.y)
         elif event.type == pygame.VIDEORESIZE:
             self.screen_width, self.screen_height = event.size
             self.update_layout()
-        return None
\ No newline at end of file
+        return None
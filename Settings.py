@@ -1,5 +1,5 @@
 import pygame
-from Utils import Slider
+from Utils import Slider, render_text
 
 class SettingsMenu:
     def __init__(self, screen_width, screen_height):
@@ -42,10 +42,10 @@ class SettingsMenu:
         pygame.draw.rect(screen, (0, 0, 0), rect, border_radius=10)  # Draw outer rectangle
         pygame.draw.rect(screen, (188, 147, 90), rect.inflate(-4, -4), border_radius=10)  # Draw inner rectangle
 
-        font = pygame.font.SysFont(None, int(36 * scale))
-        master_text = font.render("Master Volume", True, (0, 0, 0))
-        music_text = font.render("Music Volume", True, (0, 0, 0))
-        fx_text = font.render("FX Volume", True, (0, 0, 0))
+        font_size = int(36 * scale)
+        master_text = render_text("Master Volume", font_size, (0, 0, 0))
+        music_text = render_text("Music Volume", font_size, (0, 0, 0))
+        fx_text = render_text("FX Volume", font_size, (0, 0, 0))
 
         # Calculate positions based on the current scale
         master_text_pos = (rect.x + 20 * scale, rect.y + 20 * scale)
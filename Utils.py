@@ -1,4 +1,39 @@
 import pygame
+from collections import OrderedDict
+from functools import lru_cache
+
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept before the least recently used is dropped
+
+_fonts = {}  # (name, size) -> Font
+_text_cache = OrderedDict()  # (text, name, size, color, antialias) -> rendered Surface
+
+def get_font(size, name=None):
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        # SysFont(None, size) resolves to the default font, same as Font(None, size)
+        font = pygame.font.Font(None, size) if name is None else pygame.font.SysFont(name, size)
+        _fonts[key] = font
+    return font
+
+def render_text(text, size, color, antialias=True, name=None):
+    key = (text, name, size, tuple(color), antialias)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)  # Mark as most recently used
+        return surface
+    surface = get_font(size, name).render(text, antialias, color)
+    _text_cache[key] = surface
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)  # Evict least recently used
+    return surface
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def fit_font_size(text, max_size, max_width, name=None):
+    size = max_size
+    while get_font(size, name).size(text)[0] > max_width and size > 1:
+        size -= 1  # Measure instead of rendering until the text fits
+    return size
 
 class Button:
     def __init__(self, x, y, width, height, color, text='', border_radius=0):
@@ -29,8 +64,7 @@ class Button:
         pygame.draw.rect(screen, (0, 0, 0), self.rect, 2, border_radius=self.border_radius)  # Draw button border
         if self.text:
             font_size = int(32 * (screen.get_width() / 800))  # Adjust font size based on screen width
-            font = pygame.font.Font(None, font_size)  # Create font
-            text = font.render(self.text, True, (255, 255, 255))  # Render text
+            text = render_text(self.text, font_size, (255, 255, 255))  # Render text (cached)
             text_rect = text.get_rect(center=self.rect.center)  # Center text
             screen.blit(text, text_rect)  # Draw text
 
@@ -73,14 +107,9 @@ class Slider:
 
         padding = 0.5
         available_width = self.rect.width - self.handle_radius * 2 - padding * 2  # Available width for text
-        font_size = int(self.rect.height * 1.5)  # Initial font size
-        font = pygame.font.Font(None, font_size)  # Create font
-        percentage_text = font.render(f"{int((self.value - self.min_val) / (self.max_val - self.min_val) * 100)}%", True, (0, 0, 0))  # Render percentage text
-        
-        while percentage_text.get_width() > available_width and font_size > 1:
-            font_size -= 1  # Decrease font size to fit
-            font = pygame.font.Font(None, font_size)  # Update font
-            percentage_text = font.render(f"{int((self.value - self.min_val) / (self.max_val - self.min_val) * 100)}%", True, (0, 0, 0))  # Re-render text
+        label = f"{int((self.value - self.min_val) / (self.max_val - self.min_val) * 100)}%"  # Percentage label
+        font_size = fit_font_size(label, int(self.rect.height * 1.5), available_width)  # Largest size that fits
+        percentage_text = render_text(label, font_size, (0, 0, 0))  # Render percentage text (cached)
         
         screen.blit(percentage_text, (self.rect.right + padding, self.rect.y + (self.rect.height - percentage_text.get_height()) // 2))  # Draw percentage text
 
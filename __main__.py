@@ -1,270 +1,145 @@
+import time
+STARTUP_START = time.perf_counter()  # Reference point for the startup timing report
+
+import argparse
 import pygame
-import math
 from MainMenu import MainMenu
 from MapSelector import MapSelector
-from towers import Tower, Dart
-from ui import TowerSidebar
+from Game import Game
+from engine import SIM_PHASES, FrameProfiler, ReplayPlayer, ReplayRecorder
+from ui import LoadingScreen, ProfilerOverlay
+from AssetManager import assets
+
+startup_marks = {"imports": time.perf_counter() - STARTUP_START}  # Seconds since STARTUP_START
+
+def mark_startup(name):
+    startup_marks.setdefault(name, time.perf_counter() - STARTUP_START)
 
 # Initialize Pygame
 pygame.init()
 
 #TODO: Optimize the game as a whole, currently adding a lot of objects to the screen at once or even just a few causes FPS (ticks per second) to drop significantly. As a result, game is almost unplayable and runs extremely slow rounds.
-#TODO: Fix projectile rendering and collisions to have a radius / detect edge of the projectile hitting the edge of bloon instead of the center of the projectile hitting the center of the bloon.
 
 # Screen settings
 SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
 pygame.display.set_caption("Tower Defense Game")
+mark_startup("display")
 
 # Colors
 WHITE = (255, 255, 255)
-RED = (255, 0, 0)
-BLUE = (0, 0, 255)
-BLACK = (0, 0, 0)
-
-# Load images
-background_img = pygame.image.load('assets/map_1.png')
-background_img = pygame.transform.scale(background_img, (SCREEN_WIDTH, SCREEN_HEIGHT))
 
 # FPS and clock
 FPS = 60
 clock = pygame.time.Clock()
 
-# Bloon Class (Enemy)
-class Bloon:
-    def __init__(self, path):
-        self.image = pygame.image.load('assets/bloon.png')
-        self.rect = self.image.get_rect()
-        self.rect.center = path[0]
-        self.path = path
-        self.speed = 2
-        self.path_pos = 0
-        self.health = 100
-    
-    def move(self):
-        if self.path_pos < len(self.path) - 1:
-            target_x, target_y = self.path[self.path_pos + 1]
-            dx, dy = target_x - self.rect.centerx, target_y - self.rect.centery
-            dist = math.sqrt(dx**2 + dy**2)
-            if dist > 0:
-                dx, dy = dx / dist, dy / dist
-                self.rect.centerx += dx * self.speed
-                self.rect.centery += dy * self.speed
-
-            if dist < 5:
-                self.path_pos += 1
-
-    def draw(self):
-        screen.blit(self.image, self.rect.topleft)
-
-# Game Class
-class Game:
-    def __init__(self):
-        self.bloons = []
-        self.towers = []
-        self.darts = []
-        self.round = 1
-        self.lives = 100
-        self.money = 500
-        self.path = [(4, 400), (171, 400), (171, 184), (362, 184), (362, 608), 
-                     (97, 608), (97, 771), (757, 771), (757, 526), (537, 526), 
-                     (537, 326), (755, 326), (755, 91), (471, 91), (471, 4)]
-        self.original_path = self.path.copy()
-        self.sidebar = TowerSidebar(SCREEN_WIDTH, SCREEN_HEIGHT)
-        self.selected_tower = None
-        self.dragging_tower = None
-        
-        # Wave spawning variables
-        self.bloons_per_wave = 5
-        self.bloons_spawned = 0
-        self.spawn_delay = 120  # 2 seconds at 60 FPS
-        self.spawn_timer = 0
-        self.wave_in_progress = False
-        self.wave_complete = False
-        self.wave_start_delay = 180  # 3 seconds between waves
-
-    def start_wave(self):
-        if not self.wave_in_progress and not self.wave_complete:
-            self.wave_in_progress = True
-            self.bloons_spawned = 0
-            self.spawn_timer = 0
-        elif self.wave_complete:
-            self.round += 1
-            self.bloons_per_wave = 5 + (self.round - 1) * 2  # Increase bloons per wave
-            self.wave_in_progress = True
-            self.wave_complete = False
-            self.bloons_spawned = 0
-            self.spawn_timer = 0
-
-    def spawn_bloon(self):
-        if self.wave_in_progress:
-            if self.bloons_spawned < self.bloons_per_wave:
-                if self.spawn_timer >= self.spawn_delay:
-                    self.bloons.append(Bloon(self.path))
-                    self.bloons_spawned += 1
-                    self.spawn_timer = 0
-                else:
-                    self.spawn_timer += 1
-            elif len(self.bloons) == 0:  # All bloons from wave are gone
-                self.wave_in_progress = False
-                self.wave_complete = True
-                self.spawn_timer = 0
-
-    def update_bloons(self):
-        for bloon in self.bloons[:]:
-            bloon.move()
-            if bloon.path_pos >= len(bloon.path) - 1:
-                self.bloons.remove(bloon)
-                self.lives -= 1
-            if bloon.health <= 0:
-                self.bloons.remove(bloon)
-                self.money += 1
-
-    def update_towers(self):
-        for tower in self.towers:
-            tower.shoot(self.bloons, self.darts)
-
-    def update_darts(self):
-        for dart in self.darts[:]:
-            dart.move()
-            if not dart.active:
-                self.darts.remove(dart)
-                continue
-                
-            for bloon in self.bloons:
-                if dart.rect.colliderect(bloon.rect):
-                    bloon.health -= 50
-                    self.darts.remove(dart)
-                    break
-
-    def draw(self):
-        screen.blit(background_img, (0, 0))
-
-        # Draw path
-        for i in range(len(self.path) - 1):
-            pygame.draw.line(screen, BLUE, self.path[i], self.path[i + 1], 5)
-
-        # Draw game objects
-        for bloon in self.bloons:
-            bloon.draw()
-
-        for tower in self.towers:
-            tower.draw(screen)
-
-        for dart in self.darts:
-            dart.draw(screen)
-
-        # Draw sidebar
-        self.sidebar.draw(screen)
-
-        # Draw UI elements
-        font = pygame.font.SysFont(None, 36)
-        money_text = font.render(f"Money: ${self.money}", True, BLACK)
-        lives_text = font.render(f"Lives: {self.lives}", True, BLACK)
-        round_text = font.render(f"Round: {self.round}", True, BLACK)
-        screen.blit(money_text, (10, 10))
-        screen.blit(lives_text, (10, 50))
-        screen.blit(round_text, (10, 90))
-
-        # Draw wave status
-        if self.wave_complete:
-            wave_text = font.render("Press SPACE for next wave", True, (0, 255, 0))
-            screen.blit(wave_text, (SCREEN_WIDTH // 2 - 150, 10))
-        elif not self.wave_in_progress:
-            wave_text = font.render("Press SPACE to start wave", True, (255, 255, 0))
-            screen.blit(wave_text, (SCREEN_WIDTH // 2 - 150, 10))
-
-    def handle_events(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:  # Left click
-                pos = pygame.mouse.get_pos()
-                
-                # Check if clicking in sidebar
-                if self.sidebar.rect.collidepoint(pos):
-                    tower = self.sidebar.handle_mouse_down(pos)
-                    if tower and self.money >= tower.cost:
-                        self.dragging_tower = tower
-                else:
-                    # Check if clicking on existing tower
-                    for tower in self.towers:
-                        if tower.rect.collidepoint(pos):
-                            # Deselect other towers
-                            for t in self.towers:
-                                t.is_selected = False
-                            tower.is_selected = True
-                            self.selected_tower = tower
-                            break
-                    else:
-                        # Deselect all towers if clicking empty space
-                        for tower in self.towers:
-                            tower.is_selected = False
-                        self.selected_tower = None
-
-        elif event.type == pygame.MOUSEBUTTONUP:
-            if event.button == 1 and self.dragging_tower:
-                pos = pygame.mouse.get_pos()
-                if not self.sidebar.rect.collidepoint(pos):
-                    # Place tower if we have enough money
-                    if self.money >= self.dragging_tower.cost:
-                        self.money -= self.dragging_tower.cost
-                        self.towers.append(self.dragging_tower)
-                self.dragging_tower = None
-
-        elif event.type == pygame.MOUSEMOTION:
-            if self.dragging_tower:
-                self.dragging_tower.rect.center = pygame.mouse.get_pos()
-
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 3:  # Right click
-            if self.selected_tower:
-                action = self.selected_tower.handle_click(event.pos)
-                if action == "upgrade":
-                    if self.money >= self.selected_tower.upgrade_cost:
-                        if self.selected_tower.upgrade():
-                            self.money -= self.selected_tower.upgrade_cost
-                elif action == "sell":
-                    self.money += self.selected_tower.sell()
-                    self.towers.remove(self.selected_tower)
-                    self.selected_tower = None
+# Per-frame timing; F3 toggles the overlay, F4 exports the buffered frames to CSV
+FRAME_PHASES = SIM_PHASES + ('draw', 'events', 'display')
+PROFILE_FRAMES = 600  # 10 seconds at 60 FPS
+
+# Decoded on worker threads behind the loading screen; map images stay lazy (thumbnails, per-game backgrounds)
+STARTUP_ASSETS = [
+    ('assets/background.png', False), ('assets/settings_icon.png', True),
+    ('assets/map_selector_background.png', False),
+    ('assets/bloon.png', True), ('assets/dart.png', True), ('assets/tower.png', True),
+]
+LOADER_THREADS = 4
+
+def run_loading_screen(preloader):
+    # Returns False if the window was closed before loading finished
+    global screen
+    loading = LoadingScreen()
+    while not preloader.finished:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                preloader.cancel()
+                return False
+            elif event.type == pygame.VIDEORESIZE:
+                screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+        preloader.poll()
+        loading.draw(screen, preloader.progress)
+        pygame.display.update()
+        mark_startup("first_frame")
+        clock.tick(FPS)
+    mark_startup("assets")
+    return True
 
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE:
-                self.start_wave()
+def print_startup_report():
+    print("startup: " + ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in startup_marks.items()))
 
-    def resize(self, new_width, new_height):
-        global SCREEN_WIDTH, SCREEN_HEIGHT
-        SCREEN_WIDTH, SCREEN_HEIGHT = new_width, new_height
-        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
-        self.path = [(int(x * new_width / 800), int(y * new_height / 600)) 
-                    for x, y in self.original_path]
-        self.sidebar = TowerSidebar(SCREEN_WIDTH, SCREEN_HEIGHT)
+def start_game(width, height, map_number=1, seed=0, record=False):
+    game = Game(width, height, seed=seed, map_number=map_number)
+    if record:
+        game.recorder = ReplayRecorder(seed, width, height, map_number)
+    return game
 
 # Main Game Loop
-def main():
-    game = Game()
+def main(record_path=None, replay_path=None, startup_report=False):
+    global screen
+    if not run_loading_screen(assets.preload(STARTUP_ASSETS, LOADER_THREADS)):
+        pygame.quit()
+        return
+    player = ReplayPlayer.load(replay_path) if replay_path else None
+    game = None  # Built when a map is picked, so the menu doesn't wait on it
+    if player:
+        # Playback drives the game directly; live input only reaches the overlay
+        screen = pygame.display.set_mode((player.width, player.height), pygame.RESIZABLE)
+        game = Game(player.width, player.height, seed=player.seed, map_number=player.map_number)
     main_menu = MainMenu("Player1", SCREEN_WIDTH, SCREEN_HEIGHT)
     map_selector = MapSelector(SCREEN_WIDTH, SCREEN_HEIGHT)
-    current_screen = "main_menu"
+    current_screen = "game" if player else "main_menu"
+    profiler = FrameProfiler(FRAME_PHASES, PROFILE_FRAMES)
+    overlay = ProfilerOverlay(profiler)
+    last_frame = time.perf_counter()
 
     running = True
     while running:
-        screen.fill(WHITE)
-        
-        if current_screen == "main_menu":
-            main_menu.draw(screen)
-        elif current_screen == "map_selector":
-            map_selector.draw(screen)
-        else:
-            game.spawn_bloon()
-            game.update_bloons()
-            game.update_towers()
-            game.update_darts()
-            game.draw()
-
+        if current_screen == "game":
+            if player:
+                player.apply_due(game)
+                if screen.get_size() != (game.width, game.height):
+                    # A recorded resize: the window follows it so the map, path and sidebar line up
+                    assets.evict_size(screen.get_size())
+                    screen = pygame.display.set_mode((game.width, game.height), pygame.RESIZABLE)
+                    game.request_full_redraw()
+            game.tick(profiler)
+
+        with profiler.phase('draw'):
+            dirty_rects = None  # None means the whole screen changed
+            if current_screen == "main_menu":
+                screen.fill(WHITE)
+                main_menu.draw(screen)
+            elif current_screen == "map_selector":
+                screen.fill(WHITE)
+                map_selector.draw(screen)
+            else:
+                dirty_rects = game.draw(screen)
+            counts = {"bloons": len(game.bloons), "towers": len(game.towers), "darts": len(game.darts),
+                      "bloon_hw": game.bloons.high_water, "dart_hw": game.darts.high_water,
+                      "dart_objs": game.darts.created, "culled": game.render_queue.culled,
+                      # Steady-state spawning should leave disk_loads flat; only hits should climb
+                      "asset_hits": assets.hits, "asset_misses": assets.misses,
+                      "disk_loads": assets.disk_loads} if current_screen == "game" else {}
+            overlay_rect = overlay.draw(screen, counts)
+            if overlay_rect and dirty_rects is not None:
+                dirty_rects.append(overlay_rect)
+                game.mark_dirty(overlay_rect)
+
+        events_start = time.perf_counter()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                overlay.toggle()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                profiler.export_csv(time.strftime("profile_%Y%m%d_%H%M%S.csv"))
             elif event.type == pygame.VIDEORESIZE:
-                game.resize(event.w, event.h)
+                assets.evict_size(screen.get_size())  # Drop backgrounds scaled for the old window
+                screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+                if player:
+                    game.request_full_redraw()  # Snapped back to the recorded size next frame
+                elif game:
+                    game.resize(event.w, event.h)
             elif current_screen == "main_menu":
                 result = main_menu.handle_events(event)
                 if result == "map_selector":
@@ -274,19 +149,42 @@ def main():
                 if result == "main_menu":
                     current_screen = "main_menu"
                 elif result and result.startswith("map_"):
+                    # Each map starts a fresh game built from its bundle
+                    game = start_game(*screen.get_size(), int(result[len("map_"):]), record=bool(record_path))
                     current_screen = "game"
-            else:
+            elif not player:
                 game.handle_events(event)
 
         if current_screen == "main_menu":
             main_menu.settings_menu.update()
         elif current_screen == "map_selector":
             pass
+        profiler.record('events', time.perf_counter() - events_start)
 
-        pygame.display.update()
+        with profiler.phase('display'):
+            if dirty_rects is None:
+                pygame.display.update()
+            else:
+                pygame.display.update(dirty_rects)
         clock.tick(FPS)
 
+        now = time.perf_counter()
+        profiler.end_frame(now - last_frame)
+        last_frame = now
+        if "interactive" not in startup_marks:
+            mark_startup("interactive")  # First menu (or replay) frame is on screen
+            if startup_report:
+                print_startup_report()
+
+    if record_path and game and game.recorder is not None:
+        game.recorder.save(record_path)
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Tower Defense Game")
+    session = parser.add_mutually_exclusive_group()  # A played-back game takes no input to record
+    session.add_argument("--record", metavar="PATH", help="Record tower actions and wave starts to a replay file")
+    session.add_argument("--replay", metavar="PATH", help="Play back a recorded session (Headless.py --replay skips rendering)")
+    parser.add_argument("--startup-report", action="store_true", help="Print time to first frame and to the first menu frame")
+    args = parser.parse_args()
+    main(args.record, args.replay, args.startup_report)
\ No newline at end of file
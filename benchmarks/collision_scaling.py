@@ -0,0 +1,72 @@
+import argparse
+import time
+import numpy as np
+from engine import BloonSwarm, TrackPath
+
+# Run from the repository root: python -m benchmarks.collision_scaling
+
+DART_RADIUS = 10.0
+
+
+def brute_force_first_overlaps(swarm: BloonSwarm, darts: np.ndarray) -> np.ndarray:
+    # The pre-broadphase test: every dart checks every bloon
+    n = swarm.count
+    x, y, radius = swarm.x[:n], swarm.y[:n], swarm.radius[:n]
+    first = np.full(len(darts), -1, dtype=np.intp)
+    for d, (dx, dy) in enumerate(darts):
+        hits = np.flatnonzero((x - dx) ** 2 + (y - dy) ** 2 < (radius + DART_RADIUS) ** 2)
+        if hits.size:
+            first[d] = hits[0]
+    return first
+
+
+def build_swarm(bloons: int, bloon_radius: float, rng: np.random.Generator) -> BloonSwarm:
+    swarm = BloonSwarm(TrackPath([(0, 0), (800, 0)]), bloon_radius, capacity=bloons)
+    for _ in range(bloons):
+        swarm.spawn()
+    swarm.x[:bloons] = rng.uniform(0, 800, bloons)
+    swarm.y[:bloons] = rng.uniform(0, 600, bloons)
+    swarm.invalidate_index()
+    return swarm
+
+
+def time_tick(swarm: BloonSwarm, darts: np.ndarray, use_hash: bool, repeats: int) -> float:
+    best = float('inf')
+    radii = np.full(len(darts), DART_RADIUS)
+    for _ in range(repeats):
+        swarm.invalidate_index()  # Every tick pays for a full rebuild
+        start = time.perf_counter()
+        if use_hash:
+            swarm.first_overlaps(darts[:, 0], darts[:, 1], radii)
+        else:
+            brute_force_first_overlaps(swarm, darts)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dart-bloon collision scaling benchmark")
+    parser.add_argument("--bloons", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    parser.add_argument("--darts", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--bloon-radius", type=float, default=20.0)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'bloons':>8} {'darts':>6} {'brute ms':>10} {'hash ms':>10} {'speedup':>8}")
+    for bloons in args.bloons:
+        swarm = build_swarm(bloons, args.bloon_radius, rng)
+        for dart_count in args.darts:
+            darts = np.column_stack((rng.uniform(0, 800, dart_count), rng.uniform(0, 600, dart_count)))
+            expected = brute_force_first_overlaps(swarm, darts)
+            radii = np.full(dart_count, DART_RADIUS)
+            if not np.array_equal(expected, swarm.first_overlaps(darts[:, 0], darts[:, 1], radii)):
+                raise SystemExit(f"Spatial hash disagrees with brute force at {bloons} bloons / {dart_count} darts")
+            brute = time_tick(swarm, darts, False, args.repeats)
+            hashed = time_tick(swarm, darts, True, args.repeats)
+            print(f"{bloons:>8} {dart_count:>6} {brute:>10.3f} {hashed:>10.3f} {brute / hashed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
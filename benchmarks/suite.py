@@ -0,0 +1,139 @@
+import os
+
+# Benchmarks never need a real window; must be set before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import itertools
+import json
+import random
+import sys
+from typing import Dict, List
+import pygame
+from Game import Game
+from engine import PhaseTimer
+from towers import Tower
+
+# Run from the repository root:
+#   python -m benchmarks.suite --output results.json
+#   python -m benchmarks.suite --baseline baseline.json --threshold 0.25
+
+PHASES = ('spawn', 'bloons', 'towers', 'darts', 'draw')
+
+
+def build_game(bloons: int, towers: int, seed: int) -> Game:
+    game = Game(seed=seed)
+    game.money = float('inf')  # Scenarios place towers regardless of cost
+    game.enforce_placement = False  # ...and pack them tighter than players may
+    rng = random.Random(seed)
+    track = game.track
+    for i in range(towers):
+        # Spread towers along the path, alternating sides of it
+        distance = track.total_length * (i + 0.5) / towers
+        x, y = track.position(distance)
+        seg = int(track.segment_indices(distance))
+        nx, ny = -track.directions[seg][1], track.directions[seg][0]
+        side = 40 if i % 2 == 0 else -40
+        game.place_tower(Tower(int(x + nx * side), int(y + ny * side)))
+    top_up(game, bloons, rng)
+    return game
+
+
+def top_up(game: Game, target: int, rng: random.Random) -> None:
+    # Keep the live population constant so every tick measures the same load
+    swarm = game.bloons
+    while swarm.count < target:
+        i = swarm.spawn(health=rng.choice((50, 100, 150)))
+        swarm.progress[i] = rng.uniform(0, swarm.path.total_length * 0.9)
+    swarm.x[:swarm.count], swarm.y[:swarm.count] = swarm.path.positions(swarm.progress[:swarm.count])
+    swarm.invalidate_index()
+
+
+def run_scenario(bloons: int, towers: int, ticks: int, warmup: int, seed: int,
+                 screen: pygame.Surface) -> Dict[str, object]:
+    game = build_game(bloons, towers, seed)
+    rng = random.Random(seed)
+    timer = PhaseTimer()
+    for tick in range(warmup + ticks):
+        if tick == warmup:
+            timer.reset()
+        with timer.phase("spawn"):
+            top_up(game, bloons, rng)
+        with timer.phase("bloons"):
+            game.update_bloons()
+        with timer.phase("towers"):
+            game.update_towers()
+        with timer.phase("darts"):
+            game.update_darts()
+        with timer.phase("draw"):
+            game.draw(screen)
+    return {
+        "name": f"b{bloons}_t{towers}",
+        "bloons": bloons,
+        "towers": towers,
+        "ticks": ticks,
+        "phases": timer.summary_ms(),
+    }
+
+
+def compare(results: List[Dict[str, object]], baseline: List[Dict[str, object]],
+            threshold: float, floor_ms: float) -> List[str]:
+    # A phase regresses when it is slower than the baseline by more than the threshold
+    # ratio and by more than floor_ms, which filters out timer noise on tiny phases
+    previous = {entry["name"]: entry for entry in baseline}
+    failures = []
+    for result in results:
+        base = previous.get(result["name"])
+        if base is None:
+            continue
+        for phase, stats in result["phases"].items():
+            old = base["phases"].get(phase)
+            if old is None:
+                continue
+            now, before = stats["mean_ms"], old["mean_ms"]
+            if now > before * (1 + threshold) and now - before > floor_ms:
+                failures.append(f"{result['name']} {phase}: {before:.3f} ms -> {now:.3f} ms")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scripted per-phase tick benchmarks")
+    parser.add_argument("--bloons", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--towers", type=int, nargs="+", default=[5, 50, 200])
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Fail if any phase regresses against this results file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown ratio (0.25 = 25%%)")
+    parser.add_argument("--floor-ms", type=float, default=0.05, help="Ignore regressions smaller than this")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+
+    results = []
+    print(f"{'scenario':>12} " + " ".join(f"{phase:>9}" for phase in PHASES) + "   (mean ms per tick)")
+    for bloons, towers in itertools.product(args.bloons, args.towers):
+        result = run_scenario(bloons, towers, args.ticks, args.warmup, args.seed, screen)
+        results.append(result)
+        print(f"{result['name']:>12} " + " ".join(f"{result['phases'][phase]['mean_ms']:>9.3f}" for phase in PHASES))
+    pygame.quit()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures = compare(results, json.load(f), args.threshold, args.floor_ms)
+        if failures:
+            print("Regressions:")
+            for failure in failures:
+                print("  " + failure)
+            sys.exit(1)
+        print("No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import os
+
+# Checks never need a real window; must be set before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Sequence, Tuple
+from Game import Game
+from Headless import run_headless
+from towers import DartPool, Tower
+
+# Run from the repository root:
+#   python -m benchmarks.time_steps
+#   python -m benchmarks.time_steps --steps 1 4 7 45 --output steps.json
+#
+# Larger time steps should only cost precision, never change the outcome. Exits non-zero
+# if any scenario's result differs between steps.
+
+Point = Tuple[int, int]
+
+# name -> (rounds, towers, pixel_collisions)
+SCENARIOS: Dict[str, Tuple[int, List[Point], bool]] = {
+    "two_towers": (10, [(170, 490), (590, 300)], False),
+    "pixel_collisions": (4, [(170, 490)], True),
+}
+
+
+def fire_rate(time_step: float, frames: float = 6000) -> int:
+    # Darts from one tower whose target never leaves range, over the same stretch of game time
+    tower, darts = Tower(0, 0), DartPool()
+    game_time = 0.0
+    while game_time < frames:
+        tower.shoot((100.0, 0.0), darts, time_step)
+        game_time += time_step
+    return len(darts)
+
+
+def play_scenario(rounds: int, towers: Sequence[Point], pixel_collisions: bool, time_step: float) -> Dict[str, int]:
+    game = Game()
+    game.pixel_collisions = pixel_collisions
+    summary = run_headless(rounds, towers, game=game, time_step=time_step)
+    return {key: summary[key] for key in ("round", "lives", "pops", "leaks")}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that results don't depend on the simulation time step")
+    parser.add_argument("--steps", type=float, nargs="+", default=[1, 4, 7, 45])
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results: Dict[str, Dict[float, object]] = {"fire_rate": {step: fire_rate(step) for step in args.steps}}
+    for name, (rounds, towers, pixel_collisions) in SCENARIOS.items():
+        results[name] = {step: play_scenario(rounds, towers, pixel_collisions, step) for step in args.steps}
+
+    failures = []
+    for name, by_step in results.items():
+        print(f"{name:>18} " + "  ".join(f"{step:g}: {outcome}" for step, outcome in by_step.items()))
+        if any(outcome != by_step[args.steps[0]] for outcome in by_step.values()):
+            failures.append(name)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if failures:
+        print("Depends on the time step: " + ", ".join(failures))
+        sys.exit(1)
+    print("Same results at every time step")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+from .path import TrackPath
+from .placement import PlacementGrid
+from .mapfile import PLAYFIELD_SIZE, MapBundle, build_bundle, load_bundle, save_bundle, simplify_path
+from .spatial_hash import SpatialHash
+from .swarm import BloonSwarm, earliest_hits, first_hits
+from .targeting import TARGETING_STRATEGIES, select_targets
+from .timing import SIM_PHASES, FrameProfiler, PhaseTimer
+from .replay import ReplayPlayer, ReplayRecorder
+from .waves import BloonType, SpawnGroup, SpawnQueue, WaveSchedule
+
+__all__ = [
+    'TrackPath', 'PlacementGrid', 'SpatialHash', 'BloonSwarm', 'first_hits', 'earliest_hits',
+    'PLAYFIELD_SIZE', 'MapBundle', 'build_bundle', 'load_bundle', 'save_bundle', 'simplify_path',
+    'TARGETING_STRATEGIES', 'select_targets',
+    'SIM_PHASES', 'PhaseTimer', 'FrameProfiler',
+    'ReplayRecorder', 'ReplayPlayer',
+    'BloonType', 'SpawnGroup', 'SpawnQueue', 'WaveSchedule',
+]
@@ -0,0 +1,117 @@
+import json
+import struct
+import numpy as np
+from typing import Dict, List, Sequence, Tuple
+from .path import TrackPath
+from .placement import PlacementGrid
+
+# File layout: header, JSON metadata, then raw little-endian arrays each aligned for np.memmap
+MAGIC = b"TDMP"
+VERSION = 1
+HEADER = struct.Struct("<4sBI")  # magic, version, metadata length
+ALIGN = 64
+
+TRACK_TABLES = ('points', 'lengths', 'directions', 'starts')
+
+# Window size Game opens at; bundles are baked for it so a default session recomputes nothing
+PLAYFIELD_SIZE = (800, 600)
+
+
+def simplify_path(points: Sequence[Tuple[float, float]], epsilon: float) -> List[Tuple[float, float]]:
+    # Ramer-Douglas-Peucker: keep a waypoint only if dropping it moves the path by more than epsilon
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(pts) < 3:
+        return [tuple(p) for p in pts.tolist()]
+    keep = np.zeros(len(pts), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(pts) - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j <= i + 1:
+            continue
+        a, d = pts[i], pts[j] - pts[i]
+        offsets = pts[i + 1:j] - a
+        # Distance to the segment, not the infinite line, so a path doubling back is kept
+        length_sq = float(d @ d)
+        t = np.clip(offsets @ d / length_sq, 0.0, 1.0) if length_sq > 0 else np.zeros(len(offsets))
+        distance = np.hypot(offsets[:, 0] - t * d[0], offsets[:, 1] - t * d[1])
+        k = int(np.argmax(distance))
+        if distance[k] > epsilon:
+            keep[i + 1 + k] = True
+            stack.extend(((i, i + 1 + k), (i + 1 + k, j)))
+    return [tuple(p) for p in pts[keep].tolist()]
+
+
+class MapBundle:
+    def __init__(self, image: str, width: int, height: int, track: TrackPath, distance: np.ndarray,
+                 footprint: float, path_half_width: float, cell_size: int):
+        self.image = image  # Background image path, relative to the repository root
+        self.width, self.height = width, height  # Playfield size the waypoints and tables were built for
+        self.track = track
+        self.distance = distance  # PlacementGrid distance field at width x height
+        self.footprint = footprint
+        self.path_half_width = path_half_width
+        self.cell_size = cell_size
+
+    @property
+    def waypoints(self) -> List[Tuple[float, float]]:
+        return [tuple(p) for p in self.track.points.tolist()]
+
+    def placement_grid(self) -> PlacementGrid:
+        # Fresh occupancy on top of the shared, precomputed distance field
+        return PlacementGrid(self.width, self.height, self.track, self.footprint, self.path_half_width,
+                             self.cell_size, distance=self.distance)
+
+
+def build_bundle(image: str, image_size: Tuple[int, int], waypoints: Sequence[Tuple[float, float]],
+                 footprint: float, size: Tuple[int, int] = PLAYFIELD_SIZE, path_half_width: float = 30,
+                 cell_size: int = 4, epsilon: float = 1.5) -> MapBundle:
+    # Waypoints are traced in image pixels and stretched to the playfield, as Game draws the background
+    sx, sy = size[0] / image_size[0], size[1] / image_size[1]
+    track = TrackPath(simplify_path([(x * sx, y * sy) for x, y in waypoints], epsilon))
+    grid = PlacementGrid(size[0], size[1], track, footprint, path_half_width, cell_size)
+    return MapBundle(image, size[0], size[1], track, grid.distance, footprint, path_half_width, cell_size)
+
+
+def save_bundle(bundle: MapBundle, path: str) -> None:
+    arrays = {name: getattr(bundle.track, name) for name in TRACK_TABLES}
+    arrays['distance'] = bundle.distance
+    meta: Dict[str, object] = {
+        "image": bundle.image, "width": bundle.width, "height": bundle.height,
+        "footprint": bundle.footprint, "path_half_width": bundle.path_half_width, "cell_size": bundle.cell_size,
+    }
+    # Offsets depend on the metadata length, which depends on the offsets; reserve room and settle in two passes
+    table = {name: {"dtype": np.asarray(a).dtype.newbyteorder('<').str, "shape": list(np.shape(a)), "offset": 0}
+             for name, a in arrays.items()}
+    for _ in range(2):
+        meta["arrays"] = table
+        offset = _align(HEADER.size + len(json.dumps(meta).encode()) + ALIGN)
+        for name, a in arrays.items():
+            table[name]["offset"] = offset
+            offset = _align(offset + np.asarray(a).nbytes)
+    blob = json.dumps(meta).encode()
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(blob)))
+        f.write(blob)
+        for name, a in arrays.items():
+            f.write(b"\0" * (table[name]["offset"] - f.tell()))
+            f.write(np.ascontiguousarray(a, dtype=table[name]["dtype"]).tobytes())
+
+
+def load_bundle(path: str) -> MapBundle:
+    # Tables are memory-mapped read-only; nothing is recomputed
+    with open(path, "rb") as f:
+        magic, version, meta_len = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} map bundle")
+        meta = json.loads(f.read(meta_len))
+    arrays = {name: np.memmap(path, dtype=spec["dtype"], mode='r', offset=spec["offset"], shape=tuple(spec["shape"]))
+              for name, spec in meta["arrays"].items()}
+    track = TrackPath.from_tables(*(arrays[name] for name in TRACK_TABLES))
+    return MapBundle(meta["image"], meta["width"], meta["height"], track, arrays['distance'],
+                     meta["footprint"], meta["path_half_width"], meta["cell_size"])
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGN) * ALIGN
@@ -0,0 +1,80 @@
+import bisect
+import numpy as np
+from typing import List, Sequence, Tuple
+
+
+class TrackPath:
+    def __init__(self, waypoints: Sequence[Tuple[float, float]]):
+        self.points = np.asarray(waypoints, dtype=np.float64).reshape(-1, 2)
+        if len(self.points) < 2:
+            raise ValueError("A path needs at least two waypoints")
+        deltas = np.diff(self.points, axis=0)
+        self.lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+        self.directions = np.divide(deltas, self.lengths[:, None], out=np.zeros_like(deltas),
+                                    where=self.lengths[:, None] > 0)
+        # starts[i] is the arc length at which segment i begins
+        self.starts = np.concatenate(([0.0], np.cumsum(self.lengths)[:-1]))
+        self.total_length = float(self.lengths.sum())
+        self._starts_list = self.starts.tolist()
+
+    @classmethod
+    def from_tables(cls, points: np.ndarray, lengths: np.ndarray, directions: np.ndarray,
+                    starts: np.ndarray) -> 'TrackPath':
+        # Rebuild from precomputed tables (e.g. a memory-mapped map bundle) without redoing the geometry
+        track = cls.__new__(cls)
+        track.points, track.lengths, track.directions, track.starts = points, lengths, directions, starts
+        track.total_length = float(lengths.sum())
+        track._starts_list = starts.tolist()
+        return track
+
+    @property
+    def segment_count(self) -> int:
+        return len(self.lengths)
+
+    def segment_indices(self, distances: np.ndarray) -> np.ndarray:
+        # side='right' skips zero-length segments left by duplicate waypoints
+        indices = np.searchsorted(self.starts, distances, side='right') - 1
+        return np.clip(indices, 0, self.segment_count - 1)
+
+    def positions(self, distances: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        seg = self.segment_indices(distances)
+        offset = np.clip(distances - self.starts[seg], 0.0, self.lengths[seg])
+        x = self.points[seg, 0] + self.directions[seg, 0] * offset
+        y = self.points[seg, 1] + self.directions[seg, 1] * offset
+        return x, y
+
+    def position(self, distance: float) -> Tuple[float, float]:
+        seg = min(max(bisect.bisect_right(self._starts_list, distance) - 1, 0), self.segment_count - 1)
+        offset = min(max(distance - self._starts_list[seg], 0.0), float(self.lengths[seg]))
+        px, py = self.points[seg]
+        dx, dy = self.directions[seg]
+        return float(px + dx * offset), float(py + dy * offset)
+
+    def remap(self, distances: np.ndarray, other: 'TrackPath') -> np.ndarray:
+        # Carry distances onto a path with the same waypoint count (e.g. after a resize),
+        # keeping each bloon at the same fraction of its current segment
+        seg = self.segment_indices(distances)
+        frac = np.divide(distances - self.starts[seg], self.lengths[seg],
+                         out=np.zeros_like(distances), where=self.lengths[seg] > 0)
+        return other.starts[seg] + np.clip(frac, 0.0, 1.0) * other.lengths[seg]
+
+    def coverage(self, cx: float, cy: float, radius: float) -> List[Tuple[float, float]]:
+        # Arc-length intervals [start, end) of the path lying within radius of (cx, cy).
+        # Solves |p + d*t - c|^2 < r^2 for t on every segment at once.
+        ox = self.points[:-1, 0] - cx
+        oy = self.points[:-1, 1] - cy
+        b = ox * self.directions[:, 0] + oy * self.directions[:, 1]
+        c = ox * ox + oy * oy - radius * radius
+        disc = b * b - c
+        root = np.sqrt(np.maximum(disc, 0.0))
+        t0 = np.clip(-b - root, 0.0, self.lengths)
+        t1 = np.clip(-b + root, 0.0, self.lengths)
+        inside = (disc > 0) & (t1 > t0)
+
+        intervals: List[Tuple[float, float]] = []
+        for start, end in zip((self.starts + t0)[inside].tolist(), (self.starts + t1)[inside].tolist()):
+            if intervals and start <= intervals[-1][1] + 1e-9:
+                intervals[-1] = (intervals[-1][0], end)  # Joins across a corner
+            else:
+                intervals.append((start, end))
+        return intervals
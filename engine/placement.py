@@ -0,0 +1,67 @@
+import numpy as np
+from typing import Optional, Tuple
+from .path import TrackPath
+
+
+class PlacementGrid:
+    def __init__(self, width: int, height: int, track: TrackPath, footprint: float,
+                 path_half_width: float = 30, cell_size: int = 4, distance: Optional[np.ndarray] = None):
+        self.width, self.height = width, height
+        self.cell_size = cell_size
+        self.footprint = float(footprint)  # Radius every tower keeps clear around its centre
+        self.path_half_width = float(path_half_width)
+        self.cols = -(-width // cell_size)
+        self.rows = -(-height // cell_size)
+        # Both grids are indexed [row, col]; built once per map and window size unless a map bundle supplies it
+        self.distance = self._distance_field(track) if distance is None else distance  # Cell centre to path
+        self.blocked = self.distance < self.path_half_width + self.footprint
+        self.occupancy = np.zeros((self.rows, self.cols), dtype=np.int32)  # Towers whose footprint reaches each cell
+
+    def _cell_centres(self) -> Tuple[np.ndarray, np.ndarray]:
+        xs = (np.arange(self.cols) + 0.5) * self.cell_size
+        ys = (np.arange(self.rows) + 0.5) * self.cell_size
+        return np.meshgrid(xs, ys)
+
+    def _distance_field(self, track: TrackPath) -> np.ndarray:
+        px, py = self._cell_centres()
+        distance = np.full(px.shape, np.inf)
+        for (ax, ay), (dx, dy), length in zip(track.points[:-1], track.directions, track.lengths):
+            # Project every cell onto the segment, clamp to its ends, keep the closest segment
+            t = np.clip((px - ax) * dx + (py - ay) * dy, 0.0, length)
+            np.minimum(distance, np.hypot(px - (ax + dx * t), py - (ay + dy * t)), out=distance)
+        return distance.astype(np.float32)
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(y) // self.cell_size, int(x) // self.cell_size
+
+    def in_bounds(self, x: float, y: float) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def distance_to_path(self, x: float, y: float) -> float:
+        return float(self.distance[self._cell(x, y)]) if self.in_bounds(x, y) else float('inf')
+
+    def can_place(self, x: float, y: float) -> bool:
+        # Constant time: the path clearance and other towers' footprints are already rasterised
+        if not self.in_bounds(x, y):
+            return False
+        cell = self._cell(x, y)
+        return not self.blocked[cell] and not self.occupancy[cell]
+
+    def _stamp(self, x: float, y: float, delta: int) -> None:
+        # Mark every centre that would bring another tower's footprint over this one
+        reach = 2 * self.footprint
+        c0, c1 = max(0, int((x - reach) // self.cell_size)), min(self.cols, int((x + reach) // self.cell_size) + 1)
+        r0, r1 = max(0, int((y - reach) // self.cell_size)), min(self.rows, int((y + reach) // self.cell_size) + 1)
+        if c0 >= c1 or r0 >= r1:
+            return
+        xs = (np.arange(c0, c1) + 0.5) * self.cell_size - x
+        ys = (np.arange(r0, r1) + 0.5) * self.cell_size - y
+        disk = xs[None, :] ** 2 + ys[:, None] ** 2 < reach * reach
+        region = self.occupancy[r0:r1, c0:c1]
+        region[disk] = region[disk] + delta
+
+    def occupy(self, x: float, y: float) -> None:
+        self._stamp(x, y, 1)
+
+    def release(self, x: float, y: float) -> None:
+        self._stamp(x, y, -1)
@@ -0,0 +1,66 @@
+import struct
+from typing import List, NamedTuple
+
+# File layout: header, then one fixed-size record per event, all little-endian
+MAGIC = b"TDRP"
+VERSION = 2  # 2 added the map number
+HEADER = struct.Struct("<4sBqHHH")  # magic, version, seed, width, height, map number
+RECORD = struct.Struct("<IBhhh")  # tick, action, a, b, c
+
+# Action codes; a/b carry a position, a tower index or a window size, c a catalog slot
+PLACE, UPGRADE, SELL, TARGET, START_WAVE, RESIZE = range(6)
+ACTION_NAMES = ('place', 'upgrade', 'sell', 'target', 'start_wave', 'resize')
+
+
+class ReplayEvent(NamedTuple):
+    tick: int
+    action: int
+    a: int = 0
+    b: int = 0
+    c: int = 0
+
+
+class ReplayRecorder:
+    def __init__(self, seed: int, width: int, height: int, map_number: int = 1):
+        self.seed, self.width, self.height, self.map_number = seed, width, height, map_number
+        self.events: List[ReplayEvent] = []
+
+    def record(self, tick: int, action: int, a: int = 0, b: int = 0, c: int = 0) -> None:
+        self.events.append(ReplayEvent(tick, action, a, b, c))
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed, self.width, self.height, self.map_number))
+            for event in self.events:
+                f.write(RECORD.pack(*event))
+
+
+class ReplayPlayer:
+    def __init__(self, seed: int, width: int, height: int, map_number: int, events: List[ReplayEvent]):
+        self.seed, self.width, self.height, self.map_number = seed, width, height, map_number
+        self.events = events
+        self.position = 0
+
+    @classmethod
+    def load(cls, path: str) -> 'ReplayPlayer':
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, seed, width, height, map_number = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} replay file")
+        events = [ReplayEvent(*fields) for fields in RECORD.iter_unpack(data[HEADER.size:])]
+        return cls(seed, width, height, map_number, events)
+
+    @property
+    def finished(self) -> bool:
+        return self.position >= len(self.events)
+
+    @property
+    def last_tick(self) -> int:
+        return self.events[-1].tick if self.events else 0
+
+    def apply_due(self, game: 'Game') -> None:
+        # Re-inject every event recorded before the game's next tick
+        while self.position < len(self.events) and self.events[self.position].tick <= game.ticks:
+            game.apply_replay_event(self.events[self.position])
+            self.position += 1
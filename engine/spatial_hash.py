@@ -0,0 +1,56 @@
+import numpy as np
+from typing import Tuple
+
+_CY_OFFSET = 1 << 31
+
+
+def _pack(cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+    # Pack signed cell coordinates into one integer key that sorts by (cx, cy)
+    return (cx.astype(np.int64) << 32) + (cy.astype(np.int64) + _CY_OFFSET)
+
+
+class SpatialHash:
+    def __init__(self, cell_size: float):
+        self.cell_size = float(cell_size)
+        self._order = np.zeros(0, dtype=np.intp)  # Entity indices grouped by cell
+        self._cell_keys = np.zeros(0, dtype=np.int64)  # Sorted keys of occupied cells
+        self._starts = np.zeros(0, dtype=np.intp)  # Slice of _order for each cell
+        self._counts = np.zeros(0, dtype=np.intp)
+
+    def rebuild(self, x: np.ndarray, y: np.ndarray) -> None:
+        keys = _pack(np.floor(x / self.cell_size), np.floor(y / self.cell_size))
+        self._order = np.argsort(keys, kind='stable')
+        self._cell_keys, self._starts, self._counts = np.unique(keys[self._order], return_index=True,
+                                                                return_counts=True)
+
+    def query_rects(self, left: np.ndarray, top: np.ndarray,
+                    right: np.ndarray, bottom: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # Returns (query, entity) index pairs for every entity whose centre lies in a cell
+        # touched by the query rect; all queries are answered in one vectorized pass
+        empty = np.zeros(0, dtype=np.intp)
+        if len(left) == 0 or len(self._cell_keys) == 0:
+            return empty, empty
+        cx0 = np.floor(left / self.cell_size).astype(np.int64)
+        cy0 = np.floor(top / self.cell_size).astype(np.int64)
+        span_x = np.floor(right / self.cell_size).astype(np.int64) - cx0
+        span_y = np.floor(bottom / self.cell_size).astype(np.int64) - cy0
+
+        query_ids = np.arange(len(left))
+        queries, entities = [], []
+        for ox in range(int(span_x.max()) + 1):
+            for oy in range(int(span_y.max()) + 1):
+                wanted = (span_x >= ox) & (span_y >= oy)
+                keys = _pack(cx0 + ox, cy0 + oy)
+                slot = np.minimum(np.searchsorted(self._cell_keys, keys), len(self._cell_keys) - 1)
+                hit = wanted & (self._cell_keys[slot] == keys)
+                if not hit.any():
+                    continue
+                slot = slot[hit]
+                counts = self._counts[slot]
+                # Expand each (query, cell) match into one pair per entity in that cell
+                first = np.repeat(self._starts[slot] - np.cumsum(counts) + counts, counts)
+                queries.append(np.repeat(query_ids[hit], counts))
+                entities.append(self._order[first + np.arange(counts.sum())])
+        if not queries:
+            return empty, empty
+        return np.concatenate(queries), np.concatenate(entities)
@@ -0,0 +1,200 @@
+import numpy as np
+from typing import List, NamedTuple, Optional, Tuple
+from .path import TrackPath
+from .spatial_hash import SpatialHash
+
+
+class SwarmView(NamedTuple):
+    x: np.ndarray
+    y: np.ndarray
+    radius: np.ndarray
+    health: np.ndarray
+    progress: np.ndarray
+
+
+def first_hits(query_count: int, query: np.ndarray, hit: np.ndarray) -> np.ndarray:
+    # Reduce (query, bloon) pairs to the lowest bloon index per query, or -1
+    lowest = np.full(query_count, np.iinfo(np.intp).max, dtype=np.intp)
+    if query.size:
+        np.minimum.at(lowest, query, hit)
+    return np.where(lowest < np.iinfo(np.intp).max, lowest, -1)
+
+
+def earliest_hits(query_count: int, query: np.ndarray, hit: np.ndarray, t: np.ndarray) -> np.ndarray:
+    # Reduce (query, bloon, t) triples to the bloon met first along each sweep, or -1;
+    # equal times fall back to the lowest bloon index, matching first_hits
+    earliest = np.full(query_count, -1, dtype=np.intp)
+    if query.size:
+        order = np.lexsort((hit, t, query))
+        queries, first = np.unique(query[order], return_index=True)
+        earliest[queries] = hit[order[first]]
+    return earliest
+
+
+class BloonSwarm:
+    def __init__(self, path: TrackPath, radius: float, capacity: int = 256):
+        self.path = path
+        self.default_radius = float(radius)
+        self.max_radius = self.default_radius  # Widest bloon ever spawned, for broadphase padding
+        self.index = SpatialHash(2 * self.default_radius)
+        self._index_dirty = True
+        self._order_dirty = True
+        self._progress_order = np.zeros(0, dtype=np.intp)  # Bloon indices sorted by progress
+        self._sorted_progress = np.zeros(0, dtype=np.float64)
+        self.count = 0
+        self.high_water = 0  # Most bloons live at once
+        self.capacity = 0
+        self.x = np.zeros(0, dtype=np.float64)
+        self.y = np.zeros(0, dtype=np.float64)
+        self.speed = np.zeros(0, dtype=np.float64)
+        self.radius = np.zeros(0, dtype=np.float64)
+        self.health = np.zeros(0, dtype=np.float64)
+        self.progress = np.zeros(0, dtype=np.float64)  # Distance travelled along the path
+        self._grow(capacity)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def set_path(self, path: TrackPath) -> None:
+        n = self.count
+        if n and path.segment_count == self.path.segment_count:
+            self.progress[:n] = self.path.remap(self.progress[:n], path)
+            self.x[:n], self.y[:n] = path.positions(self.progress[:n])
+            self.invalidate_index()
+        self.path = path
+
+    def _grow(self, capacity: int) -> None:
+        # Arrays only ever grow, so steady-state ticks never reallocate
+        for name in ('x', 'y', 'speed', 'radius', 'health', 'progress'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def spawn(self, health: float = 100, speed: float = 2, radius: Optional[float] = None,
+              progress: float = 0.0) -> int:
+        # progress starts a late spawn part-way along the path, where it would be had it entered on time
+        if self.count == self.capacity:
+            self._grow(max(16, self.capacity * 2))
+        i = self.count
+        self.x[i], self.y[i] = self.path.position(progress)
+        self.speed[i] = speed
+        self.radius[i] = self.default_radius if radius is None else radius
+        self.max_radius = max(self.max_radius, self.radius[i])
+        self.health[i] = health
+        self.progress[i] = progress
+        self.count += 1
+        self.high_water = max(self.high_water, self.count)
+        self.invalidate_index()
+        return i
+
+    def step(self, dt: float = 1.0) -> Tuple[int, int]:
+        n = self.count
+        if n == 0:
+            return 0, 0
+        # Bloons popped by last tick's darts go first, so they can't be carried past the exit and leak
+        popped = self.health[:n] <= 0
+        popped_count = int(popped.sum())
+        if popped_count:
+            self._compact(~popped)
+            n = self.count
+
+        # Advance along the path by arc length, so fast bloons never overshoot a corner
+        progress = self.progress[:n]
+        progress += self.speed[:n] * dt
+        self.x[:n], self.y[:n] = self.path.positions(progress)
+        self.invalidate_index()
+
+        leaked = progress >= self.path.total_length
+        if leaked.any():
+            self._compact(~leaked)
+        return int(leaked.sum()), popped_count
+
+    def _compact(self, keep: np.ndarray) -> None:
+        n = self.count
+        k = int(keep.sum())
+        # Swap-remove: survivors from the tail fill the holes left in the first k slots,
+        # so only removed slots are written. Order is not kept; targeting sorts by progress.
+        holes = np.flatnonzero(~keep[:k])
+        movers = np.flatnonzero(keep[k:n]) + k
+        for arr in (self.x, self.y, self.speed, self.radius, self.health, self.progress):
+            arr[holes] = arr[movers]
+        self.count = k
+        self.invalidate_index()
+
+    def position(self, index: int) -> Tuple[float, float]:
+        return float(self.x[index]), float(self.y[index])
+
+    def invalidate_index(self) -> None:
+        # Call after writing positions or progress directly into the arrays
+        self._index_dirty = True
+        self._order_dirty = True
+
+    def progress_order(self) -> Tuple[np.ndarray, np.ndarray]:
+        # (bloon indices, their progress) in ascending progress order, sorted once per tick
+        if self._order_dirty:
+            self._progress_order = np.argsort(self.progress[:self.count], kind='stable')
+            self._sorted_progress = self.progress[self._progress_order]
+            self._order_dirty = False
+        return self._progress_order, self._sorted_progress
+
+    def rebuild_index(self) -> None:
+        if self._index_dirty:
+            self.index.rebuild(self.x[:self.count], self.y[:self.count])
+            self._index_dirty = False
+
+    def circle_hits(self, x: np.ndarray, y: np.ndarray, radius: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # (query, bloon) pairs whose circles overlap; edges touch, not centres
+        empty = np.zeros(0, dtype=np.intp)
+        if self.count == 0 or len(x) == 0:
+            return empty, empty
+        self.rebuild_index()
+        reach = radius + self.max_radius
+        query, bloon = self.index.query_rects(x - reach, y - reach, x + reach, y + reach)
+        dx = self.x[bloon] - x[query]
+        dy = self.y[bloon] - y[query]
+        limit = self.radius[bloon] + radius[query]
+        hit = dx * dx + dy * dy < limit * limit
+        return query[hit], bloon[hit]
+
+    def segment_hits(self, x0: np.ndarray, y0: np.ndarray, x1: np.ndarray, y1: np.ndarray,
+                     radius: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # (query, bloon, t) for circles swept from (x0, y0) to (x1, y1) that touch a bloon,
+        # t in [0, 1] being the fraction of the sweep at first contact
+        empty = np.zeros(0, dtype=np.intp)
+        if self.count == 0 or len(x0) == 0:
+            return empty, empty, np.zeros(0, dtype=np.float64)
+        self.rebuild_index()
+        reach = radius + self.max_radius
+        query, bloon = self.index.query_rects(np.minimum(x0, x1) - reach, np.minimum(y0, y1) - reach,
+                                              np.maximum(x0, x1) + reach, np.maximum(y0, y1) + reach)
+        # Solve |p0 + t * d - c| = r for the smaller root; a sweep starting inside hits at t = 0
+        dx, dy = (x1 - x0)[query], (y1 - y0)[query]
+        fx, fy = x0[query] - self.x[bloon], y0[query] - self.y[bloon]
+        limit = self.radius[bloon] + radius[query]
+        a = dx * dx + dy * dy
+        b = fx * dx + fy * dy
+        c = fx * fx + fy * fy - limit * limit
+        disc = b * b - a * c
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.where(c < 0, 0.0, (-b - np.sqrt(np.maximum(disc, 0.0))) / a)
+        hit = (c < 0) | ((a > 0) & (disc > 0) & (t >= 0) & (t <= 1))
+        return query[hit], bloon[hit], t[hit]
+
+    def first_overlaps(self, x: np.ndarray, y: np.ndarray, radius: np.ndarray) -> np.ndarray:
+        # For each circle, the lowest-index overlapping bloon, or -1
+        query, bloon = self.circle_hits(x, y, radius)
+        return first_hits(len(x), query, bloon)
+
+    def damage_many(self, indices: np.ndarray, amount: float) -> None:
+        np.subtract.at(self.health, indices, amount)
+
+    def view(self) -> SwarmView:
+        n = self.count
+        arrays: List[np.ndarray] = []
+        for arr in (self.x, self.y, self.radius, self.health, self.progress):
+            v = arr[:n].view()
+            v.flags.writeable = False
+            arrays.append(v)
+        return SwarmView(*arrays)
@@ -0,0 +1,39 @@
+import numpy as np
+from typing import List, Sequence
+from .swarm import BloonSwarm
+
+# Strategy names in the order the tower UI cycles through them
+TARGETING_STRATEGIES = ('first', 'last', 'strong', 'close')
+
+
+def select_targets(swarm: BloonSwarm, towers: Sequence['Tower']) -> List[int]:
+    # Returns a bloon index (or -1) per tower. Each tower's coverage intervals are
+    # bisected against the swarm's progress order, which is sorted once per tick.
+    targets = [-1] * len(towers)
+    if not towers or swarm.count == 0:
+        return targets
+    order, progress = swarm.progress_order()
+
+    for t, tower in enumerate(towers):
+        # Slices of the progress order that lie inside the tower's range
+        slices = []
+        for start, end in tower.coverage:
+            lo, hi = np.searchsorted(progress, (start, end))
+            if hi > lo:
+                slices.append((lo, hi))
+        if not slices:
+            continue
+
+        if tower.targeting == 'first':
+            targets[t] = int(order[slices[-1][1] - 1])
+        elif tower.targeting == 'last':
+            targets[t] = int(order[slices[0][0]])
+        else:
+            candidates = np.concatenate([order[lo:hi] for lo, hi in slices])
+            if tower.targeting == 'strong':
+                targets[t] = int(candidates[np.argmax(swarm.health[candidates])])
+            else:
+                dx = swarm.x[candidates] - tower.rect.centerx
+                dy = swarm.y[candidates] - tower.rect.centery
+                targets[t] = int(candidates[np.argmin(dx * dx + dy * dy)])
+    return targets
@@ -0,0 +1,90 @@
+import csv
+import time
+import numpy as np
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+# Simulation phases in the order Game.tick runs them
+SIM_PHASES = ('spawn', 'bloons', 'towers', 'darts')
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}  # Phase name -> durations in seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        self.samples.setdefault(name, []).append(seconds)
+
+    def reset(self) -> None:
+        self.samples.clear()
+
+    def summary_ms(self) -> Dict[str, Dict[str, float]]:
+        summary = {}
+        for name, samples in self.samples.items():
+            ordered = sorted(samples)
+            summary[name] = {
+                "mean_ms": sum(ordered) / len(ordered) * 1000,
+                "p50_ms": ordered[len(ordered) // 2] * 1000,
+                "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+                "max_ms": ordered[-1] * 1000,
+            }
+        return summary
+
+
+class FrameProfiler:
+    def __init__(self, phases: Sequence[str], size: int = 600):
+        self.phases = tuple(phases)
+        self._columns = {name: i for i, name in enumerate(self.phases)}
+        # Fixed-size ring buffer: one row per frame, frame time first, then each phase
+        self.rows = np.zeros((size, len(self.phases) + 1), dtype=np.float64)
+        self.index = 0
+        self.filled = 0
+        self._current = np.zeros(len(self.phases), dtype=np.float64)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        self._current[self._columns[name]] += seconds
+
+    def end_frame(self, frame_seconds: float) -> None:
+        row = self.rows[self.index]
+        row[0] = frame_seconds
+        row[1:] = self._current
+        self._current[:] = 0.0
+        self.index = (self.index + 1) % len(self.rows)
+        self.filled = min(self.filled + 1, len(self.rows))
+
+    def latest_ms(self) -> Dict[str, float]:
+        if not self.filled:
+            return {}
+        row = self.rows[self.index - 1] * 1000
+        return dict(zip(('frame',) + self.phases, row.tolist()))
+
+    def percentiles_ms(self) -> Dict[str, Tuple[float, float, float]]:
+        # (p50, p95, p99) for the frame time and each phase over the buffered frames
+        if not self.filled:
+            return {}
+        values = np.percentile(self.rows[:self.filled] * 1000, (50, 95, 99), axis=0)
+        return {name: tuple(values[:, i].tolist()) for i, name in enumerate(('frame',) + self.phases)}
+
+    def export_csv(self, path: str) -> None:
+        # Oldest frame first
+        ordered = np.roll(self.rows, -self.index, axis=0)[-self.filled:] if self.filled else self.rows[:0]
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow([f"{name}_ms" for name in ('frame',) + self.phases])
+            writer.writerows((ordered * 1000).round(4).tolist())
@@ -0,0 +1,99 @@
+import heapq
+import itertools
+import json
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class BloonType(NamedTuple):
+    name: str
+    health: float = 100
+    speed: float = 2
+
+
+class SpawnGroup(NamedTuple):
+    bloon: str
+    count: int
+    spacing: int = 120  # Ticks between consecutive spawns
+    delay: int = 0  # Ticks after the wave starts before the first spawn
+    count_per_round: int = 0  # Endless groups grow by this many bloons each round
+    start_round: int = 1  # Endless groups stay empty before this round
+
+    def count_for(self, round_number: int) -> int:
+        if round_number < self.start_round:
+            return 0
+        return max(0, self.count + self.count_per_round * (round_number - self.start_round))
+
+    def spawn_ticks(self, start_tick: int, round_number: int) -> Iterator[int]:
+        # Generated on demand, so a group of a million bloons costs no more memory than one of five
+        first = start_tick + self.delay
+        return (first + i * self.spacing for i in range(self.count_for(round_number)))
+
+
+class SpawnQueue:
+    def __init__(self, streams: Iterable[Tuple[BloonType, Iterator[int]]]):
+        # One heap entry per group: (next spawn tick, insertion order, bloon type, remaining ticks)
+        self._heap: List[Tuple[int, int, BloonType, Iterator[int]]] = []
+        self._order = itertools.count()  # Breaks ties so same-tick spawns keep schedule order
+        for bloon, ticks in streams:
+            self._push(bloon, ticks)
+
+    def _push(self, bloon: BloonType, ticks: Iterator[int]) -> None:
+        tick = next(ticks, None)
+        if tick is not None:
+            heapq.heappush(self._heap, (tick, next(self._order), bloon, ticks))
+
+    @property
+    def empty(self) -> bool:
+        return not self._heap
+
+    @property
+    def next_tick(self) -> Optional[int]:
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, tick: float) -> List[Tuple[int, BloonType]]:
+        # (due tick, bloon type) for every spawn due by tick; with a long time step some fell due
+        # partway through the last one. Cost is proportional to the spawns due now, not to the size of the wave
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= tick:
+            due_tick, _, bloon, ticks = heapq.heappop(heap)
+            due.append((due_tick, bloon))
+            self._push(bloon, ticks)
+        return due
+
+
+class WaveSchedule:
+    def __init__(self, bloon_types: Dict[str, BloonType], waves: List[List[SpawnGroup]],
+                 endless: List[SpawnGroup]):
+        for group in itertools.chain(endless, *waves):
+            if group.bloon not in bloon_types:
+                raise ValueError(f"Wave group uses unknown bloon type {group.bloon!r}")
+            if group.spacing < 0 or group.delay < 0:
+                raise ValueError(f"Wave group for {group.bloon!r} has a negative spacing or delay")
+        self.bloon_types = bloon_types
+        self.waves = waves  # Hand-written waves, one list of groups per round
+        self.endless = endless  # Template used for every round past the hand-written ones
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'WaveSchedule':
+        bloon_types = {name: BloonType(name, **fields) for name, fields in data["bloon_types"].items()}
+        waves = [[SpawnGroup(**group) for group in wave] for wave in data.get("waves", [])]
+        endless = [SpawnGroup(**group) for group in data.get("endless", [])]
+        return cls(bloon_types, waves, endless)
+
+    @classmethod
+    def load(cls, path: str) -> 'WaveSchedule':
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    def groups(self, round_number: int) -> List[SpawnGroup]:
+        if 1 <= round_number <= len(self.waves):
+            return self.waves[round_number - 1]
+        return self.endless
+
+    def bloon_count(self, round_number: int) -> int:
+        return sum(group.count_for(round_number) for group in self.groups(round_number))
+
+    def compile(self, round_number: int, start_tick: int) -> SpawnQueue:
+        return SpawnQueue((self.bloon_types[group.bloon], group.spawn_ticks(start_tick, round_number))
+                          for group in self.groups(round_number))
@@ -1,4 +1,4 @@
 from .tower import Tower
-from .dart import Dart
+from .dart import Dart, DartPool
 
-__all__ = ['Tower', 'Dart'] 
\ No newline at end of file
+__all__ = ['Tower', 'Dart', 'DartPool'] 
\ No newline at end of file
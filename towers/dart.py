@@ -1,41 +1,125 @@
 import pygame
 import math
-from typing import Tuple
+import numpy as np
+from typing import Iterator, List, Tuple
+from AssetManager import assets
+
+# Number of pre-rendered dart headings; fewer steps use less memory, more give smoother aim
+ROTATION_STEPS = 64
+
 
 class Dart:
-    def __init__(self, x: float, y: float, target: 'Bloon'):
-        self.image = pygame.image.load('assets/dart.png')
-        self.image = pygame.transform.scale(self.image, (20, 35))
-        self.rect = self.image.get_rect(center=(x, y))
+    # Fixed attribute layout: no per-instance __dict__, and instances are recycled by DartPool
+    __slots__ = ('image', 'rect', 'x', 'y', 'prev_x', 'prev_y', 'speed', 'target', 'dx', 'dy',
+                 'rotation', 'frame', 'radius', 'active')
+
+    def __init__(self, x: float, y: float, target: Tuple[float, float]):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.launch(x, y, target)
+
+    def launch(self, x: float, y: float, target: Tuple[float, float]) -> None:
+        # (Re)initialise in place so pooled darts reuse their Rect
+        rotations = assets.get_rotations('assets/dart.png', (20, 35), ROTATION_STEPS)
+        # Exact float position; the rect is only its rounded image for drawing
+        self.x, self.y = self.prev_x, self.prev_y = float(x), float(y)
         self.speed = 5
         self.target = target
         self.dx, self.dy = self.calculate_velocity()
         self.rotation = math.degrees(math.atan2(-self.dy, self.dx))
-        self.image = pygame.transform.rotate(self.image, self.rotation)
-        self.rect = self.image.get_rect(center=(x, y))
+        self.frame = rotations.frame_index(self.rotation)
+        self.image = rotations.get_frame(self.frame)
+        self.rect.size = self.image.get_size()
+        self.rect.center = (x, y)
+        self.radius = min(rotations.base.get_size()) / 2  # Collision circle around the dart centre
         self.active = True
 
     def calculate_velocity(self) -> Tuple[float, float]:
-        dx = self.target.rect.centerx - self.rect.centerx
-        dy = self.target.rect.centery - self.rect.centery
+        dx = self.target[0] - self.x
+        dy = self.target[1] - self.y
         dist = math.sqrt(dx**2 + dy**2)
         if dist > 0:
             return dx / dist * self.speed, dy / dist * self.speed
         return 0, 0
 
-    def move(self) -> None:
+    def move(self, width: int, height: int, dt: float = 1.0) -> None:
         if not self.active:
             return
-            
-        self.rect.x += self.dx
-        self.rect.y += self.dy
-
-        # Check if dart is off screen
-        screen = pygame.display.get_surface()
-        if (self.rect.right < 0 or self.rect.left > screen.get_width() or
-            self.rect.bottom < 0 or self.rect.top > screen.get_height()):
+
+        # The segment prev -> current is what collision sweeps, so no step is too long to hit
+        self.prev_x, self.prev_y = self.x, self.y
+        self.x += self.dx * dt
+        self.y += self.dy * dt
+        self.rect.center = (round(self.x), round(self.y))
+
+        # Check if dart has left the play area
+        if (self.rect.right < 0 or self.rect.left > width or
+            self.rect.bottom < 0 or self.rect.top > height):
             self.active = False
 
-    def draw(self, screen: pygame.Surface) -> None:
-        if self.active:
-            screen.blit(self.image, self.rect.topleft) 
\ No newline at end of file
+    def get_mask(self) -> pygame.mask.Mask:
+        return assets.get_rotations('assets/dart.png', (20, 35), ROTATION_STEPS).get_mask(self.frame)
+
+
+class DartPool:
+    def __init__(self):
+        self.active: List[Dart] = []  # Live darts; order is not preserved
+        self.free: List[Dart] = []  # Retired darts waiting to be relaunched
+        self.created = 0  # Dart objects ever constructed
+        self.high_water = 0  # Most darts live at once
+        # Reused collision buffers, grown to the high-water mark: start and end of each dart's last move
+        self.x0 = np.zeros(0, dtype=np.float64)
+        self.y0 = np.zeros(0, dtype=np.float64)
+        self.x1 = np.zeros(0, dtype=np.float64)
+        self.y1 = np.zeros(0, dtype=np.float64)
+        self.radius = np.zeros(0, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def __iter__(self) -> Iterator[Dart]:
+        return iter(self.active)
+
+    def __getitem__(self, index: int) -> Dart:
+        return self.active[index]
+
+    def spawn(self, x: float, y: float, target: Tuple[float, float]) -> Dart:
+        if self.free:
+            dart = self.free.pop()
+            dart.launch(x, y, target)
+        else:
+            dart = Dart(x, y, target)
+            self.created += 1
+        self.active.append(dart)
+        if len(self.active) > self.high_water:
+            self.high_water = len(self.active)
+        return dart
+
+    def remove_at(self, index: int) -> None:
+        # Swap-remove: O(1), moves the last dart into the hole
+        dart = self.active[index]
+        last = self.active.pop()
+        if index < len(self.active):
+            self.active[index] = last
+        self.free.append(dart)
+
+    def remove_inactive(self) -> None:
+        for i in range(len(self.active) - 1, -1, -1):
+            if not self.active[i].active:
+                self.remove_at(i)
+
+    def collision_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # Swept segments (x0, y0) -> (x1, y1) and radii packed into preallocated buffers
+        n = len(self.active)
+        if len(self.x0) < n:
+            size = max(16, self.high_water)
+            self.x0, self.y0, self.x1, self.y1, self.radius = (np.zeros(size, dtype=np.float64) for _ in range(5))
+        x0, y0, x1, y1, radius = self.x0, self.y0, self.x1, self.y1, self.radius
+        for i, dart in enumerate(self.active):
+            x0[i], y0[i] = dart.prev_x, dart.prev_y
+            x1[i], y1[i] = dart.x, dart.y
+            radius[i] = dart.radius
+        return x0[:n], y0[:n], x1[:n], y1[:n], radius[:n]
+
+    def clear(self) -> None:
+        while self.active:
+            self.remove_at(len(self.active) - 1)
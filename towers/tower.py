@@ -1,12 +1,18 @@
 import pygame
-import math
-from typing import List, Tuple
-from .dart import Dart
+from typing import List, Optional, Tuple
+from AssetManager import assets
+from Utils import render_text
+from .dart import DartPool
+from engine.targeting import TARGETING_STRATEGIES
 
 class Tower:
+    # Catalog data, readable without constructing a tower
+    image_path = 'assets/tower.png'
+    base_cost = 50
+    footprint = 25  # Radius kept clear of the path and of other towers
+
     def __init__(self, x: int, y: int):
-        self.image = pygame.image.load('assets/tower.png')
-        self.image = pygame.transform.scale(self.image, (80, 80))
+        self.image = assets.get_image(self.image_path, (80, 80))
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         self.range = 100
@@ -14,7 +20,10 @@ class Tower:
         self.cooldown = 30
         self.last_shot = 0
         self.level = 1
-        self.cost = 50
+        self.targeting = TARGETING_STRATEGIES[0]
+        self.track = None  # Path the tower was placed beside
+        self.coverage: List[Tuple[float, float]] = []  # Path-progress intervals within range
+        self.cost = self.base_cost
         self.sell_value = int(self.cost * 0.7)  # 70% refund when selling
         self.upgrade_cost = int(self.cost * 1.5)  # 150% of base cost for upgrade
         self.is_selected = False
@@ -28,37 +37,65 @@ class Tower:
             self.range *= 1.2
             self.cooldown = max(10, self.cooldown - 5)  # Minimum cooldown of 10
             self.upgrade_cost = int(self.upgrade_cost * 1.5)
+            self.update_coverage()
             return True
         return False
 
+    def place_on(self, track: 'TrackPath') -> None:
+        self.track = track
+        self.update_coverage()
+
+    def update_coverage(self) -> None:
+        # Towers never move once placed, so range only needs mapping onto the path here
+        if self.track is not None:
+            self.coverage = self.track.coverage(self.rect.centerx, self.rect.centery, self.range)
+
     def sell(self) -> int:
         return self.sell_value
 
-    def shoot(self, bloons: List['Bloon'], darts: List[Dart]) -> None:
-        for bloon in bloons:
-            dist = math.sqrt((bloon.rect.centerx - self.rect.centerx)**2 + 
-                           (bloon.rect.centery - self.rect.centery)**2)
-            if dist < self.range and self.last_shot >= self.cooldown:
-                darts.append(Dart(self.rect.centerx, self.rect.centery, bloon))
-                self.last_shot = 0
-                break
-        self.last_shot += 1
+    def is_ready(self) -> bool:
+        return self.last_shot >= self.cooldown
+
+    def shoot(self, target: Optional[Tuple[float, float]], darts: DartPool, dt: float = 1.0) -> int:
+        # Returns the darts fired. The cooldown left over after a shot carries into the next one,
+        # so the fire rate doesn't depend on the time step; a step longer than the cooldown
+        # fires every shot that came due during it
+        shots = 0
+        if self.is_ready():
+            if target is None:
+                self.last_shot = self.cooldown - dt  # Idle: hold exactly one shot for the first target
+            else:
+                shots = int(self.last_shot // self.cooldown)
+                for _ in range(shots):
+                    darts.spawn(self.rect.centerx, self.rect.centery, target)
+                self.last_shot -= shots * self.cooldown
+        self.last_shot += dt
+        return shots
+
+    def cycle_targeting(self) -> None:
+        index = TARGETING_STRATEGIES.index(self.targeting)
+        self.targeting = TARGETING_STRATEGIES[(index + 1) % len(TARGETING_STRATEGIES)]
 
-    def draw(self, screen: pygame.Surface) -> None:
-        screen.blit(self.image, self.rect.topleft)
+    def draw_selection(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        # Range and action buttons; Game blits the sprite itself through its render queue
+        drawn = []
         if self.is_selected:
             # Draw range circle
-            pygame.draw.circle(screen, (255, 255, 255, 128), self.rect.center, self.range, 1)
+            drawn.append(pygame.draw.circle(screen, (255, 255, 255, 128), self.rect.center, self.range, 1))
             # Draw upgrade/sell buttons
-            self._draw_buttons(screen)
+            drawn.extend(self._draw_buttons(screen))
+        return drawn
 
-    def _draw_buttons(self, screen: pygame.Surface) -> None:
-        font = pygame.font.SysFont(None, 24)
+    def _draw_buttons(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        drawn = []
         if self.level < 3:
-            upgrade_text = font.render(f"Upgrade (${self.upgrade_cost})", True, (0, 255, 0))
-            screen.blit(upgrade_text, (self.rect.x, self.rect.y - 30))
-        sell_text = font.render(f"Sell (${self.sell_value})", True, (255, 0, 0))
-        screen.blit(sell_text, (self.rect.x, self.rect.y - 60))
+            upgrade_text = render_text(f"Upgrade (${self.upgrade_cost})", 24, (0, 255, 0))
+            drawn.append(screen.blit(upgrade_text, (self.rect.x, self.rect.y - 30)))
+        sell_text = render_text(f"Sell (${self.sell_value})", 24, (255, 0, 0))
+        drawn.append(screen.blit(sell_text, (self.rect.x, self.rect.y - 60)))
+        target_text = render_text(f"Target: {self.targeting}", 24, (255, 255, 255))
+        drawn.append(screen.blit(target_text, (self.rect.x, self.rect.y - 90)))
+        return drawn
 
     def handle_click(self, pos: Tuple[int, int]) -> str:
         if self.is_selected:
@@ -71,6 +108,10 @@ class Tower:
             sell_rect = pygame.Rect(self.rect.x, self.rect.y - 60, 100, 20)
             if sell_rect.collidepoint(pos):
                 return "sell"
+            # Check if targeting button was clicked
+            target_rect = pygame.Rect(self.rect.x, self.rect.y - 90, 100, 20)
+            if target_rect.collidepoint(pos):
+                return "target"
         return ""
 
     def start_drag(self, pos: Tuple[int, int]) -> None:
@@ -1,3 +1,6 @@
 from .tower_sidebar import TowerSidebar
+from .profiler_overlay import ProfilerOverlay
+from .loading_screen import LoadingScreen
+from .render_queue import RENDER_LAYERS, RenderQueue
 
-__all__ = ['TowerSidebar'] 
\ No newline at end of file
+__all__ = ['TowerSidebar', 'ProfilerOverlay', 'LoadingScreen', 'RENDER_LAYERS', 'RenderQueue']
\ No newline at end of file
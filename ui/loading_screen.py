@@ -0,0 +1,24 @@
+import pygame
+from Utils import render_text
+
+
+class LoadingScreen:
+    # Drawn while assets decode, so it must not need any of them: plain shapes and the default font
+    def __init__(self, title: str = "Loading..."):
+        self.title = title
+        self.background = (24, 24, 24)
+        self.bar_color = (129, 254, 7)
+        self.border_color = (255, 255, 255)
+
+    def draw(self, screen: pygame.Surface, progress: float) -> None:
+        width, height = screen.get_size()
+        screen.fill(self.background)
+        title = render_text(self.title, 48, self.border_color)
+        screen.blit(title, title.get_rect(center=(width // 2, height // 2 - 40)))
+
+        bar = pygame.Rect(0, 0, width // 2, 24)
+        bar.center = (width // 2, height // 2 + 20)
+        filled = bar.copy()
+        filled.width = int(bar.width * max(0.0, min(progress, 1.0)))
+        pygame.draw.rect(screen, self.bar_color, filled, border_radius=6)
+        pygame.draw.rect(screen, self.border_color, bar, 2, border_radius=6)
@@ -0,0 +1,40 @@
+import pygame
+from typing import Dict, Optional
+from engine.timing import FrameProfiler
+from Utils import get_font
+
+
+class ProfilerOverlay:
+    def __init__(self, profiler: FrameProfiler):
+        self.profiler = profiler
+        self.visible = False
+        self.line_height = 16
+        self.padding = 6
+        self.counts_per_line = 4  # Keeps the panel narrower than the playfield
+
+    def toggle(self) -> None:
+        self.visible = not self.visible
+
+    def draw(self, screen: pygame.Surface, counts: Dict[str, int]) -> Optional[pygame.Rect]:
+        if not self.visible:
+            return None
+        latest = self.profiler.latest_ms()
+        stats = self.profiler.percentiles_ms()
+        lines = [f"{'phase':<9}{'now':>7}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for name, (p50, p95, p99) in stats.items():
+            lines.append(f"{name:<9}{latest.get(name, 0.0):>7.2f}{p50:>7.2f}{p95:>7.2f}{p99:>7.2f}")
+        items = [f"{name}: {count}" for name, count in counts.items()]
+        for i in range(0, len(items), self.counts_per_line):
+            lines.append("  ".join(items[i:i + self.counts_per_line]))
+        lines.append("F3 hide  F4 export CSV")
+
+        # Numbers change every frame, so render directly rather than through the text cache
+        font = get_font(14, "monospace")
+        rendered = [font.render(line, True, (255, 255, 255)) for line in lines]
+        width = max(text.get_width() for text in rendered) + self.padding * 2
+        height = len(rendered) * self.line_height + self.padding * 2
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        for i, text in enumerate(rendered):
+            panel.blit(text, (self.padding, self.padding + i * self.line_height))
+        return screen.blit(panel, (screen.get_width() - width - 210, 10))  # Clear of the tower sidebar
@@ -0,0 +1,46 @@
+import numpy as np
+import pygame
+from itertools import repeat
+from typing import Dict, List, Sequence
+
+# Submission order, back to front
+RENDER_LAYERS = ('bloons', 'towers', 'darts')
+
+
+class RenderQueue:
+    def __init__(self, layers: Sequence[str] = RENDER_LAYERS):
+        self.layers: Dict[str, list] = {name: [] for name in layers}  # Layer -> (surface, dest) pairs
+        self.viewport = pygame.Rect(0, 0, 0, 0)
+        self.queued = 0  # Sprites submitted last frame
+        self.culled = 0  # Sprites skipped last frame for lying outside the viewport
+
+    def begin(self, viewport: pygame.Rect) -> None:
+        self.viewport = pygame.Rect(viewport)
+        for items in self.layers.values():
+            items.clear()
+        self.queued = self.culled = 0
+
+    def add_sprites(self, layer: str, surface: pygame.Surface, x: np.ndarray, y: np.ndarray) -> None:
+        # Many copies of one sprite centred on (x, y); culled with one vectorized test
+        w, h = surface.get_size()
+        left = x.astype(np.int64) - w // 2
+        top = y.astype(np.int64) - h // 2
+        vp = self.viewport
+        visible = (left < vp.right) & (left + w > vp.left) & (top < vp.bottom) & (top + h > vp.top)
+        self.culled += len(left) - int(np.count_nonzero(visible))
+        self.layers[layer].extend(zip(repeat(surface), zip(left[visible].tolist(), top[visible].tolist())))
+
+    def add_rects(self, layer: str, surfaces: Sequence[pygame.Surface], rects: Sequence[pygame.Rect]) -> None:
+        # Per-entity sprites at their rects; collidelistall culls them in a single call
+        keep = self.viewport.collidelistall(rects)
+        self.culled += len(rects) - len(keep)
+        self.layers[layer].extend((surfaces[i], rects[i]) for i in keep)
+
+    def flush(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        # One Surface.blits per layer; returns the areas drawn, for the dirty-rect list
+        drawn: List[pygame.Rect] = []
+        for items in self.layers.values():
+            if items:
+                self.queued += len(items)
+                drawn.extend(screen.blits(items))
+        return drawn
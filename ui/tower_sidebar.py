@@ -1,9 +1,10 @@
 import pygame
-from typing import List, Tuple, Optional
+from typing import List, Optional, Sequence, Tuple, Type
+from AssetManager import assets
 from towers.tower import Tower
 
 class TowerSidebar:
-    def __init__(self, screen_width: int, screen_height: int):
+    def __init__(self, screen_width: int, screen_height: int, catalog: Optional[Sequence[Type[Tower]]] = None):
         self.width = 200
         self.height = screen_height
         self.rect = pygame.Rect(screen_width - self.width, 0, self.width, self.height)
@@ -11,6 +12,10 @@ class TowerSidebar:
         self.selected_tower: Optional[Tower] = None
         self.dragging_tower: Optional[Tower] = None
         self._initialize_tower_slots()
+        self.catalog: List[Type[Tower]] = list(catalog) if catalog else [Tower] * len(self.tower_slots)
+        self._surface: Optional[pygame.Surface] = None  # Prerendered sidebar, rebuilt on catalog change
+        self._hover_overlay: Optional[pygame.Surface] = None
+        self._locked_overlay: Optional[pygame.Surface] = None
 
     def _initialize_tower_slots(self) -> None:
         slot_width = 80
@@ -26,31 +31,55 @@ class TowerSidebar:
                 slot_rect = pygame.Rect(x, y, slot_width, slot_height)
                 self.tower_slots.append(slot_rect)
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def set_catalog(self, catalog: Sequence[Type[Tower]]) -> None:
+        self.catalog = list(catalog)
+        self._surface = None
+
+    def _render(self) -> pygame.Surface:
+        surface = pygame.Surface(self.rect.size)
+        offset = (-self.rect.x, -self.rect.y)  # Slots are stored in screen coordinates
+
         # Draw sidebar background
-        pygame.draw.rect(screen, (200, 200, 200), self.rect)
-        pygame.draw.rect(screen, (100, 100, 100), self.rect, 2)
+        surface.fill((200, 200, 200))
+        pygame.draw.rect(surface, (100, 100, 100), surface.get_rect(), 2)
 
-        # Draw tower slots
-        for slot in self.tower_slots:
-            pygame.draw.rect(screen, (150, 150, 150), slot)
-            pygame.draw.rect(screen, (100, 100, 100), slot, 1)
+        # Draw tower slots and previews
+        for tower_type, slot in zip(self.catalog, self.tower_slots):
+            local = slot.move(offset)
+            pygame.draw.rect(surface, (150, 150, 150), local)
+            pygame.draw.rect(surface, (100, 100, 100), local, 1)
+            preview = assets.get_image(tower_type.image_path, (60, 60))
+            surface.blit(preview, preview.get_rect(center=local.center))
 
-        # Draw tower previews in slots
-        for i, slot in enumerate(self.tower_slots):
-            tower = Tower(slot.centerx, slot.centery)
-            tower.image = pygame.transform.scale(tower.image, (60, 60))
-            screen.blit(tower.image, tower.image.get_rect(center=slot.center))
+        slot_size = self.tower_slots[0].size if self.tower_slots else (0, 0)
+        self._hover_overlay = pygame.Surface(slot_size, pygame.SRCALPHA)
+        self._hover_overlay.fill((255, 255, 255, 70))
+        self._locked_overlay = pygame.Surface(slot_size, pygame.SRCALPHA)
+        self._locked_overlay.fill((0, 0, 0, 110))
+        return surface
 
-        # Draw dragging tower if exists
-        if self.dragging_tower:
-            screen.blit(self.dragging_tower.image, self.dragging_tower.rect.topleft)
+    def draw(self, screen: pygame.Surface) -> None:
+        if self._surface is None:
+            self._surface = self._render()
+        screen.blit(self._surface, self.rect.topleft)
+
+    def draw_overlays(self, screen: pygame.Surface, mouse_pos: Tuple[int, int], money: float) -> List[pygame.Rect]:
+        # Per-frame highlights drawn over the prerendered sidebar; returns the rects touched
+        if self._surface is None:
+            self._surface = self._render()
+        drawn = []
+        for tower_type, slot in zip(self.catalog, self.tower_slots):
+            if money < tower_type.base_cost:
+                drawn.append(screen.blit(self._locked_overlay, slot.topleft))
+            elif slot.collidepoint(mouse_pos):
+                drawn.append(screen.blit(self._hover_overlay, slot.topleft))
+        return drawn
 
     def handle_mouse_down(self, pos: Tuple[int, int]) -> Optional[Tower]:
         # Check if clicking in a tower slot
-        for i, slot in enumerate(self.tower_slots):
+        for tower_type, slot in zip(self.catalog, self.tower_slots):
             if slot.collidepoint(pos):
-                tower = Tower(slot.centerx, slot.centery)
+                tower = tower_type(slot.centerx, slot.centery)
                 self.dragging_tower = tower
                 return tower
         return None